@@ -5,6 +5,7 @@ initializing all required components, registering routes, and configuring middle
 """
 
 import os
+from collections.abc import Mapping
 from flask import Flask
 
 # Internal imports
@@ -21,7 +22,8 @@ def create_app(config_class=None):
     Application factory function that creates and configures a Flask application instance.
     
     Args:
-        config_class: Configuration class to use for the application
+        config_class: Configuration class to use for the application, or a mapping of
+            config keys (e.g. test settings)
         
     Returns:
         Flask application instance
@@ -32,7 +34,11 @@ def create_app(config_class=None):
     # Load configuration from config_class parameter with default from get_config()
     if config_class is None:
         config_class = get_config()
-    app.config.from_object(config_class)
+    if isinstance(config_class, Mapping):
+        # from_object reads uppercase attributes, so a plain dict would load nothing
+        app.config.from_mapping(config_class)
+    else:
+        app.config.from_object(config_class)
     
     # Configure logging based on app configuration
     app_env = app.config.get('ENV', 'production')
@@ -15,7 +15,8 @@ from ..sites.models import Site
 from ..extensions import db, jwt, redis_client
 from ..utils.security import (
     hash_password, verify_password, validate_password_strength,
-    generate_token, decode_token, log_security_event
+    generate_token, generate_session_token, decode_token, log_security_event,
+    JWT_SESSION_ALGORITHM
 )
 
 # Constants
@@ -108,7 +109,7 @@ class AuthService:
             'sites': site_ids,
             'username': user.username
         }
-        token = generate_token(token_payload, current_app.config['JWT_SECRET_KEY'])
+        token = generate_session_token(token_payload, current_app.config['JWT_SECRET_KEY'])
 
         # Log successful login
         log_security_event('login_success', {
@@ -144,7 +145,9 @@ class AuthService:
         """
         try:
             # Decode token to get payload
-            payload = decode_token(token, current_app.config['JWT_SECRET_KEY'])
+            payload = decode_token(
+                token, current_app.config['JWT_SECRET_KEY'], [JWT_SESSION_ALGORITHM]
+            )
             if not payload:
                 raise BadRequest('Invalid token')
 
@@ -188,7 +191,9 @@ class AuthService:
         """
         try:
             # Decode and validate token
-            payload = decode_token(token, current_app.config['JWT_SECRET_KEY'])
+            payload = decode_token(
+                token, current_app.config['JWT_SECRET_KEY'], [JWT_SESSION_ALGORITHM]
+            )
             if not payload:
                 return None
 
@@ -11,7 +11,9 @@ from datetime import datetime, timedelta
 from flask import request, current_app, g
 
 from .models import User
-from ..utils.security import decode_token, generate_token, log_security_event
+from ..utils.security import (
+    decode_token, generate_session_token, log_security_event, JWT_SESSION_ALGORITHM
+)
 from ..utils.logging import logger
 from ..extensions import db
 
@@ -45,8 +47,8 @@ def create_auth_token(user_id: int, site_ids: List[int], expiration_hours: int =
     # Get JWT secret key from application config
     secret_key = current_app.config.get('JWT_SECRET_KEY')
     
-    # Generate JWT token using generate_token from security utils
-    token = generate_token(payload, secret_key, expiration_hours)
+    # Generate an HS256 session token using generate_session_token from security utils
+    token = generate_session_token(payload, secret_key, expiration_hours)
     
     # Log token creation event
     log_security_event('token_creation', {
@@ -79,7 +81,7 @@ def validate_auth_token(token: str) -> Optional[Dict[str, Any]]:
     secret_key = current_app.config.get('JWT_SECRET_KEY')
     
     # Decode token using decode_token from security utils
-    payload = decode_token(token, secret_key)
+    payload = decode_token(token, secret_key, [JWT_SESSION_ALGORITHM])
     
     # Log token validation result
     if payload:
@@ -53,6 +53,9 @@ class Config:
     JWT_ACCESS_TOKEN_EXPIRES = int(get_env_variable('JWT_ACCESS_TOKEN_EXPIRES', str(24 * 60 * 60)))  # 24 hours
     JWT_TOKEN_LOCATION = ['headers']
     
+    # Password hashing work factor (bcrypt cost, 2^cost rounds)
+    BCRYPT_COST = int(get_env_variable('BCRYPT_COST', '12'))
+    
     # CORS settings
     CORS_ORIGINS = get_env_variable('CORS_ORIGINS', 'http://localhost:3000').split(',')
     
@@ -122,6 +125,9 @@ class TestingConfig(Config):
     # Disable CloudWatch in testing
     CLOUDWATCH_ENABLED = False
     
+    # Minimum bcrypt cost keeps password hashing in fixtures fast
+    BCRYPT_COST = 4
+    
     # For testing we can disable site scoping if needed for certain tests
     SITE_SCOPING_ENABLED = get_env_variable('TEST_SITE_SCOPING_ENABLED', 'True').lower() == 'true'
 
@@ -53,7 +53,8 @@ access_log_format = '%(h)s %(l)s %(u)s %(t)s \"%(r)s\" %(s)s %(b)s \"%(f)s\" \"%
 capture_output = True
 
 # Preload application code before worker processes are forked
-# Reduces memory usage but may cause issues with some applications
+# Reduces memory usage (wsgi.py warms caches once in the master and workers share them
+# copy-on-write) but may cause issues with some applications
 preload_app = os.getenv('GUNICORN_PRELOAD_APP', 'false').lower() == 'true'
 
 # Use shared memory for temporary storage to improve performance
@@ -21,7 +21,7 @@ from ..utils.validators import (
     validate_pagination_params,
     validate_sort_params,
     ValidationError,
-    INTERACTION_TYPES,
+    INTERACTION_TYPES_DISPLAY,
     MAX_TITLE_LENGTH,
     MAX_LEAD_LENGTH,
     MAX_LOCATION_LENGTH,
@@ -122,7 +122,7 @@ class InteractionCreateSchema(InteractionBaseSchema):
         
         # Validate interaction type
         if 'type' in data and not validate_interaction_type(data['type']):
-            errors['type'] = f"Type must be one of: {', '.join(INTERACTION_TYPES)}"
+            errors['type'] = f"Type must be one of: {', '.join(INTERACTION_TYPES_DISPLAY)}"
         
         # Validate timezone
         if 'timezone' in data and not is_valid_timezone(data['timezone']):
@@ -190,7 +190,7 @@ class InteractionUpdateSchema(InteractionBaseSchema):
         
         # Validate interaction type
         if 'type' in data and not validate_interaction_type(data['type']):
-            errors['type'] = f"Type must be one of: {', '.join(INTERACTION_TYPES)}"
+            errors['type'] = f"Type must be one of: {', '.join(INTERACTION_TYPES_DISPLAY)}"
         
         # Validate timezone
         if 'timezone' in data and not is_valid_timezone(data['timezone']):
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from .repositories import InteractionRepository
 from .models import Interaction
-from ..utils.validators import INTERACTION_TYPES, validate_interaction, ValidationError
+from ..utils.validators import INTERACTION_TYPES_DISPLAY, validate_interaction, ValidationError
 from ..utils.date_utils import validate_date_range
 from ..utils.pagination import PaginatedResult
 from ..api.error_handlers import ResourceNotFoundError, AuthorizationError
@@ -424,7 +424,7 @@ class InteractionService:
         Returns:
             List of valid interaction types
         """
-        return INTERACTION_TYPES
+        return list(INTERACTION_TYPES_DISPLAY)
     
     def _validate_site_access(self, site_id: int) -> List[int]:
         """
@@ -353,14 +353,14 @@ class SiteRepository:
         Returns:
             True if user has access, False otherwise
         """
-        # Count user-site associations
-        count = (
-            db.session.query(UserSite)
+        # Probe for a single matching association id rather than counting them all
+        association = (
+            db.session.query(UserSite.id)
             .filter(and_(UserSite.user_id == user_id, UserSite.site_id == site_id))
-            .count()
+            .first()
         )
         
-        return count > 0
+        return association is not None
     
     def get_user_role_for_site(self, user_id: int, site_id: int) -> Optional[str]:
         """
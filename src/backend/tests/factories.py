@@ -8,12 +8,12 @@ from faker import Faker  # version 15.1.1
 import datetime  # standard library
 import random  # standard library
 import pytz  # version 2022.7
-import bcrypt  # version 4.0.1
 
 from ..auth.models import User, UserSite
 from ..sites.models import Site
 from ..interactions.models import Interaction
 from ..database import db
+from ..utils.security import hash_password
 
 # Global factory faker for generating fake data
 faker = factory.Faker
@@ -25,11 +25,12 @@ class UserFactory:
     
     class Meta:
         model = User
-        sqlalchemy_session = db.session
+        sqlalchemy_session_factory = lambda: db.session
     
     username = factory.Faker('user_name')
     email = factory.LazyAttribute(lambda o: f'{o.username}@example.com')
-    password_hash = factory.LazyFunction(lambda: bcrypt.hashpw('password'.encode(), bcrypt.gensalt()).decode())
+    # hash_password uses the app's BCRYPT_COST, which the test app lowers to BCRYPT_TEST_COST
+    password_hash = factory.LazyFunction(lambda: hash_password('password'))
     last_login = factory.LazyFunction(lambda: datetime.datetime.now())
     is_active = True
     
@@ -37,10 +38,7 @@ class UserFactory:
     def create_password(self, create, extracted, **kwargs):
         """Set password for user after creation"""
         if create and extracted and 'password' in extracted:
-            self.password_hash = bcrypt.hashpw(
-                extracted['password'].encode(), 
-                bcrypt.gensalt()
-            ).decode()
+            self.password_hash = hash_password(extracted['password'])
 
 
 @factory.alchemy.SQLAlchemyModelFactory
@@ -49,7 +47,7 @@ class SiteFactory:
     
     class Meta:
         model = Site
-        sqlalchemy_session = db.session
+        sqlalchemy_session_factory = lambda: db.session
     
     name = factory.Sequence(lambda n: f'Test Site {n}')
     description = factory.Faker('paragraph', nb_sentences=3)
@@ -62,7 +60,7 @@ class UserSiteFactory:
     
     class Meta:
         model = UserSite
-        sqlalchemy_session = db.session
+        sqlalchemy_session_factory = lambda: db.session
     
     user = factory.SubFactory(UserFactory)
     site = factory.SubFactory(SiteFactory)
@@ -76,7 +74,7 @@ class InteractionFactory:
     
     class Meta:
         model = Interaction
-        sqlalchemy_session = db.session
+        sqlalchemy_session_factory = lambda: db.session
     
     site = factory.SubFactory(SiteFactory)
     title = factory.Faker('sentence', nb_words=6)
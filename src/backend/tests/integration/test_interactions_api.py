@@ -9,17 +9,40 @@ authentication, request validation, and response formatting.
 import pytest
 import json
 from datetime import datetime, timedelta
-from dateutil import parser as dateutil_parser
+from operator import itemgetter
+from types import MappingProxyType
 
+from flask_jwt_extended import create_access_token
+
+from ..conftest import assert_interaction_shape
 from ..factories import InteractionFactory
+from ...extensions import db
 from ...interactions.models import Interaction
 
+# Fields the free-text search is matched against
+SEARCHABLE_TEXT_FIELDS = ('title', 'lead', 'description', 'notes', 'location')
+SEARCHABLE_FIELDS = SEARCHABLE_TEXT_FIELDS + ('type',)
+
+# Extract interaction IDs from API payloads
+get_id = itemgetter('interaction_id')
+
+# Static part of the create-interaction payload; datetimes are overlaid per test
+BASE_INTERACTION_PAYLOAD = MappingProxyType({
+    'title': 'New Test Interaction',
+    'type': 'Meeting',
+    'lead': 'John Doe',
+    'timezone': 'America/New_York',
+    'location': 'Conference Room A',
+    'description': 'This is a test interaction',
+    'notes': 'Additional notes for testing'
+})
+
 
 @pytest.mark.integration
-def test_get_interactions_authenticated(client, auth_headers, user_with_site, test_site, multiple_interactions):
+def test_get_interactions_authenticated(cached_client, auth_headers, user_with_site, test_site, multiple_interactions):
     """Test that authenticated users can retrieve interactions for their site."""
     # Make GET request to /api/interactions/ with auth_headers
-    response = client.get('/api/interactions/', headers=auth_headers)
+    response = cached_client.get('/api/interactions/', headers=auth_headers)
     
     # Verify response status code is 200 OK
     assert response.status_code == 200
@@ -44,39 +67,30 @@ def test_get_interactions_authenticated(client, auth_headers, user_with_site, te
     
     # Verify interaction schema matches expected structure
     if data['interactions']:
-        interaction = data['interactions'][0]
-        expected_fields = [
-            'interaction_id', 'site_id', 'title', 'type', 'lead',
-            'start_datetime', 'timezone', 'end_datetime', 'location',
-            'description', 'notes', 'created_by', 'created_at',
-            'updated_by', 'updated_at'
-        ]
-        for field in expected_fields:
-            assert field in interaction
+        assert_interaction_shape(data['interactions'][0])
 
 
 @pytest.mark.integration
-def test_get_interactions_unauthenticated(client):
+def test_get_interactions_unauthenticated(cached_client):
     """Test that unauthenticated users cannot retrieve interactions."""
     # Make GET request to /api/interactions/ without auth headers
-    response = client.get('/api/interactions/')
+    response = cached_client.get('/api/interactions/')
     
     # Verify response status code is 401 Unauthorized
     assert response.status_code == 401
 
 
 @pytest.mark.integration
-def test_get_interactions_site_scoping(client, user_with_site, test_site, secondary_site, multiple_interactions, site_interactions):
+def test_get_interactions_site_scoping(cached_client, user_with_site, test_site, secondary_site, multiple_interactions, site_interaction_ids):
     """Test that users can only retrieve interactions from their authorized sites."""
     # Create auth token for user with only test_site access
-    from ...auth.utils import create_access_token
     token = create_access_token(identity=user_with_site.user_id, additional_claims={'sites': [test_site.site_id]})
     
     # Generate auth headers with token
     auth_headers = {'Authorization': f'Bearer {token}'}
     
     # Make GET request to /api/interactions/ with auth headers
-    response = client.get('/api/interactions/', headers=auth_headers)
+    response = cached_client.get('/api/interactions/', headers=auth_headers)
     
     # Verify response status code is 200 OK
     assert response.status_code == 200
@@ -84,14 +98,10 @@ def test_get_interactions_site_scoping(client, user_with_site, test_site, second
     # Parse JSON response
     data = json.loads(response.data)
     
-    # Get interactions for both sites
-    test_site_interactions = site_interactions(test_site)
-    secondary_site_interactions = site_interactions(secondary_site)
-    
     # Verify response only contains interactions from test_site
-    test_site_ids = {interaction.interaction_id for interaction in test_site_interactions}
-    secondary_site_ids = {interaction.interaction_id for interaction in secondary_site_interactions}
-    response_ids = {interaction['interaction_id'] for interaction in data['interactions']}
+    test_site_ids = frozenset(site_interaction_ids(test_site))
+    secondary_site_ids = frozenset(site_interaction_ids(secondary_site))
+    response_ids = frozenset(map(get_id, data['interactions']))
     
     # All returned interactions should be from test_site
     assert response_ids.issubset(test_site_ids)
@@ -101,10 +111,10 @@ def test_get_interactions_site_scoping(client, user_with_site, test_site, second
 
 
 @pytest.mark.integration
-def test_get_interaction_by_id(client, auth_headers, test_interaction):
+def test_get_interaction_by_id(cached_client, auth_headers, test_interaction):
     """Test retrieving a specific interaction by ID."""
     # Make GET request to /api/interactions/{test_interaction.interaction_id} with auth_headers
-    response = client.get(f'/api/interactions/{test_interaction.interaction_id}', headers=auth_headers)
+    response = cached_client.get(f'/api/interactions/{test_interaction.interaction_id}', headers=auth_headers)
     
     # Verify response status code is 200 OK
     assert response.status_code == 200
@@ -120,25 +130,18 @@ def test_get_interaction_by_id(client, auth_headers, test_interaction):
     assert data['site_id'] == test_interaction.site_id
     
     # Verify datetime fields by parsing
-    start_dt = dateutil_parser.parse(data['start_datetime'])
+    start_dt = datetime.fromisoformat(data['start_datetime'].replace('Z', '+00:00'))
     assert start_dt.replace(microsecond=0) == test_interaction.start_datetime.replace(microsecond=0)
     
     # Verify all expected fields are present in the response
-    expected_fields = [
-        'interaction_id', 'site_id', 'title', 'type', 'lead',
-        'start_datetime', 'timezone', 'end_datetime', 'location',
-        'description', 'notes', 'created_by', 'created_at',
-        'updated_by', 'updated_at'
-    ]
-    for field in expected_fields:
-        assert field in data
+    assert_interaction_shape(data)
 
 
 @pytest.mark.integration
-def test_get_interaction_not_found(client, auth_headers):
+def test_get_interaction_not_found(cached_client, auth_headers):
     """Test proper error handling when requesting non-existent interaction."""
     # Make GET request to /api/interactions/9999 (non-existent ID) with auth_headers
-    response = client.get('/api/interactions/9999', headers=auth_headers)
+    response = cached_client.get('/api/interactions/9999', headers=auth_headers)
     
     # Verify response status code is 404 Not Found
     assert response.status_code == 404
@@ -151,7 +154,7 @@ def test_get_interaction_not_found(client, auth_headers):
 
 
 @pytest.mark.integration
-def test_get_interaction_wrong_site(client, user_with_site, secondary_site, site_interactions):
+def test_get_interaction_wrong_site(cached_client, user_with_site, secondary_site, site_interactions):
     """Test that users cannot access interactions from sites they don't have access to."""
     # Create an interaction in secondary_site
     secondary_interactions = site_interactions(secondary_site)
@@ -161,7 +164,6 @@ def test_get_interaction_wrong_site(client, user_with_site, secondary_site, site
         pytest.skip("No interaction available for secondary site")
     
     # Create auth token for user with only test_site access
-    from ...auth.utils import create_access_token
     # Get the user's sites
     user_site_ids = user_with_site.get_site_ids()
     # Make sure we're using a site that's not the secondary site
@@ -171,7 +173,7 @@ def test_get_interaction_wrong_site(client, user_with_site, secondary_site, site
     auth_headers = {'Authorization': f'Bearer {token}'}
     
     # Make GET request to /api/interactions/{secondary_site_interaction.interaction_id} with auth headers
-    response = client.get(f'/api/interactions/{secondary_interaction.interaction_id}', headers=auth_headers)
+    response = cached_client.get(f'/api/interactions/{secondary_interaction.interaction_id}', headers=auth_headers)
     
     # Verify response status code is 404 Not Found
     assert response.status_code == 404
@@ -186,25 +188,19 @@ def test_get_interaction_wrong_site(client, user_with_site, secondary_site, site
 @pytest.mark.integration
 def test_create_interaction(client, auth_headers, user_with_site, test_site):
     """Test creating a new interaction."""
-    # Create valid interaction data dictionary
+    # Overlay the datetimes, derived from a single now() snapshot, onto the static payload
+    now = datetime.now()
     interaction_data = {
-        'title': 'New Test Interaction',
-        'type': 'Meeting',
-        'lead': 'John Doe',
-        'start_datetime': (datetime.now() + timedelta(days=1)).isoformat(),
-        'timezone': 'America/New_York',
-        'end_datetime': (datetime.now() + timedelta(days=1, hours=1)).isoformat(),
-        'location': 'Conference Room A',
-        'description': 'This is a test interaction',
-        'notes': 'Additional notes for testing'
+        **BASE_INTERACTION_PAYLOAD,
+        'start_datetime': (now + timedelta(days=1)).isoformat(),
+        'end_datetime': (now + timedelta(days=1, hours=1)).isoformat()
     }
     
     # Make POST request to /api/interactions/ with auth_headers and JSON data
     response = client.post(
         '/api/interactions/',
         headers=auth_headers,
-        data=json.dumps(interaction_data),
-        content_type='application/json'
+        json=interaction_data
     )
     
     # Verify response status code is 201 Created
@@ -226,8 +222,7 @@ def test_create_interaction(client, auth_headers, user_with_site, test_site):
     assert data['created_by'] == user_with_site.user_id
     
     # Query database to confirm interaction was saved
-    from ...extensions import db
-    saved_interaction = db.session.query(Interaction).filter_by(interaction_id=data['interaction_id']).first()
+    saved_interaction = db.session.get(Interaction, data['interaction_id'])
     assert saved_interaction is not None
     assert saved_interaction.title == interaction_data['title']
 
@@ -247,8 +242,7 @@ def test_create_interaction_validation_error(client, auth_headers):
     response = client.post(
         '/api/interactions/',
         headers=auth_headers,
-        data=json.dumps(invalid_interaction_data),
-        content_type='application/json'
+        json=invalid_interaction_data
     )
     
     # Verify response status code is 400 Bad Request
@@ -283,8 +277,7 @@ def test_update_interaction(client, auth_headers, test_interaction):
     response = client.put(
         f'/api/interactions/{test_interaction.interaction_id}',
         headers=auth_headers,
-        data=json.dumps(update_data),
-        content_type='application/json'
+        json=update_data
     )
     
     # Verify response status code is 200 OK
@@ -305,8 +298,8 @@ def test_update_interaction(client, auth_headers, test_interaction):
     assert data['updated_by'] is not None
     
     # Verify updated_at is more recent than created_at
-    updated_at = dateutil_parser.parse(data['updated_at'])
-    created_at = dateutil_parser.parse(data['created_at'])
+    updated_at = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+    created_at = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
     assert updated_at > created_at
 
 
@@ -325,8 +318,7 @@ def test_update_interaction_validation_error(client, auth_headers, test_interact
     response = client.put(
         f'/api/interactions/{test_interaction.interaction_id}',
         headers=auth_headers,
-        data=json.dumps(invalid_update_data),
-        content_type='application/json'
+        json=invalid_update_data
     )
     
     # Verify response status code is 400 Bad Request
@@ -364,7 +356,7 @@ def test_delete_interaction(client, auth_headers, test_interaction, db_session):
     assert data['success'] is True
     
     # Query database to confirm interaction was deleted
-    deleted_interaction = db_session.query(Interaction).filter_by(interaction_id=interaction_id).first()
+    deleted_interaction = db_session.get(Interaction, interaction_id)
     assert deleted_interaction is None
     
     # Attempt to GET the deleted interaction
@@ -388,7 +380,6 @@ def test_delete_interaction_wrong_site(client, user_with_site, secondary_site, s
         pytest.skip("No interaction available for secondary site")
     
     # Create auth token for user with only test_site access
-    from ...auth.utils import create_access_token
     # Get the user's sites
     user_site_ids = user_with_site.get_site_ids()
     # Make sure we're using a site that's not the secondary site
@@ -407,20 +398,19 @@ def test_delete_interaction_wrong_site(client, user_with_site, secondary_site, s
     assert response.status_code == 404
     
     # Query database to confirm interaction still exists
-    from ...extensions import db
-    interaction = db.session.query(Interaction).filter_by(interaction_id=secondary_interaction.interaction_id).first()
+    interaction = db.session.get(Interaction, secondary_interaction.interaction_id)
     assert interaction is not None
 
 
 @pytest.mark.integration
-def test_search_interactions(client, auth_headers, multiple_interactions):
+def test_search_interactions(cached_client, auth_headers, multiple_interactions):
     """Test searching interactions with various criteria."""
     # Generate search criteria (e.g., title, type, lead)
     # Let's assume we know at least one interaction exists with these properties
     search_term = multiple_interactions[0].title[:10]  # First part of the title
     
     # Make GET request to /api/interactions/?search=[criteria] with auth_headers
-    response = client.get(
+    response = cached_client.get(
         f'/api/interactions/?search={search_term}',
         headers=auth_headers
     )
@@ -432,14 +422,10 @@ def test_search_interactions(client, auth_headers, multiple_interactions):
     data = json.loads(response.data)
     
     # Verify only matching interactions are returned
+    needle = search_term.lower()
     for interaction in data['interactions']:
         # Search can match any of these fields
-        match_found = False
-        for field in ['title', 'lead', 'description', 'notes', 'type', 'location']:
-            if field in interaction and interaction[field] and search_term.lower() in interaction[field].lower():
-                match_found = True
-                break
-        assert match_found
+        assert any(needle in (interaction.get(field) or '').lower() for field in SEARCHABLE_FIELDS)
     
     # Verify pagination metadata is correct
     assert 'meta' in data
@@ -447,7 +433,7 @@ def test_search_interactions(client, auth_headers, multiple_interactions):
     
     # Test multiple search parameters combined
     type_filter = multiple_interactions[0].type
-    response = client.get(
+    response = cached_client.get(
         f'/api/interactions/?search={search_term}&type={type_filter}',
         headers=auth_headers
     )
@@ -460,19 +446,14 @@ def test_search_interactions(client, auth_headers, multiple_interactions):
         assert interaction['type'] == type_filter
         
         # Verify search term matches some field
-        match_found = False
-        for field in ['title', 'lead', 'description', 'notes', 'location']:
-            if field in interaction and interaction[field] and search_term.lower() in interaction[field].lower():
-                match_found = True
-                break
-        assert match_found
+        assert any(needle in (interaction.get(field) or '').lower() for field in SEARCHABLE_TEXT_FIELDS)
 
 
 @pytest.mark.integration
-def test_interaction_pagination(client, auth_headers, multiple_interactions):
+def test_interaction_pagination(cached_client, auth_headers, multiple_interactions):
     """Test pagination of interaction results."""
     # Make GET request to /api/interactions/?page=1&page_size=10 with auth_headers
-    response = client.get(
+    response = cached_client.get(
         '/api/interactions/?page=1&page_size=10',
         headers=auth_headers
     )
@@ -506,7 +487,7 @@ def test_interaction_pagination(client, auth_headers, multiple_interactions):
     # If there are at least 2 pages, test second page
     if pagination['total_pages'] > 1:
         # Make GET request for page 2
-        response_page2 = client.get(
+        response_page2 = cached_client.get(
             '/api/interactions/?page=2&page_size=10',
             headers=auth_headers
         )
@@ -514,8 +495,8 @@ def test_interaction_pagination(client, auth_headers, multiple_interactions):
         data_page2 = json.loads(response_page2.data)
         
         # Verify different interactions returned on page 2
-        page1_ids = {interaction['interaction_id'] for interaction in data['interactions']}
-        page2_ids = {interaction['interaction_id'] for interaction in data_page2['interactions']}
+        page1_ids = frozenset(map(get_id, data['interactions']))
+        page2_ids = frozenset(map(get_id, data_page2['interactions']))
         
         # No overlap between pages
         assert page1_ids.isdisjoint(page2_ids)
@@ -528,10 +509,10 @@ def test_interaction_pagination(client, auth_headers, multiple_interactions):
 
 
 @pytest.mark.integration
-def test_get_interaction_types(client, auth_headers):
+def test_get_interaction_types(cached_client, auth_headers):
     """Test retrieving the list of valid interaction types."""
     # Make GET request to /api/interactions/types with auth_headers
-    response = client.get(
+    response = cached_client.get(
         '/api/interactions/types',
         headers=auth_headers
     )
@@ -3,21 +3,44 @@ Integration tests for site-scoping functionality, verifying that users can only
 """
 
 import pytest
-import json
 import datetime
 from typing import Dict, List, Optional
 from flask import url_for, g
 
-from ...auth.utils import create_auth_token
 from ...api.error_handlers import AuthorizationError
-from ..factories import UserFactory, SiteFactory, UserSiteFactory, InteractionFactory
+from ...auth.middlewares import auth_middleware
+from ...interactions.models import Interaction
+from ...interactions.services import InteractionService
+from ..factories import UserFactory, SiteFactory, InteractionFactory
+
+# Keep this module on one xdist worker (pytest -n auto --dist loadgroup) so it reuses its fixtures
+pytestmark = pytest.mark.xdist_group("site_scoping")
+
+# Fixed timestamps keep payloads deterministic across runs
+_BASE_TIME = datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+# Minimal valid payload shared by the create/update scoping tests
+BASE_INTERACTION_PAYLOAD = {
+    "title": "Test Interaction",
+    "type": "Meeting",
+    "lead": "John Doe",
+    "start_datetime": _BASE_TIME.isoformat(),
+    "end_datetime": (_BASE_TIME + datetime.timedelta(hours=1)).isoformat(),
+    "timezone": "America/New_York"
+}
+
+
+@pytest.fixture(scope="module")
+def interaction_service():
+    """Module-wide InteractionService; it keeps no per-request state and reads site context from flask.g."""
+    return InteractionService()
 
 
 @pytest.mark.integration
-def test_site_scoping_middleware_active(client, db_session, user_with_site, test_site):
+def test_site_scoping_middleware_active(client, db_session, user_with_site, test_site, token_for):
     """Test that site-scoping middleware is active and restricts access to authorized sites only."""
     # Create a JWT token with user's site ID
-    token = create_auth_token(user_with_site.id, [test_site.id])
+    token = token_for(user_with_site.id, (test_site.id,))
     
     # Make a request to get all interactions with the token
     response = client.get(
@@ -29,19 +52,17 @@ def test_site_scoping_middleware_active(client, db_session, user_with_site, test
     assert response.status_code == 200
     
     # Verify site context is correctly applied in the response
-    data = json.loads(response.data)
+    data = response.get_json()
     assert "site_context" in data
     assert data["site_context"]["id"] == test_site.id
 
 
 @pytest.mark.integration
-def test_site_scoping_blocks_unauthorized_site_access(client, db_session, test_user, test_site, secondary_site):
+def test_site_scoping_blocks_unauthorized_site_access(client, db_session, user_with_site, secondary_site, token_for):
     """Test that site-scoping blocks access to sites the user is not associated with."""
-    # Associate user with only the first site
-    UserSiteFactory(user=test_user, site=test_site, role="Editor")
-    
+    # user_with_site is associated with only the first site
     # Create a JWT token with unauthorized site ID (secondary_site)
-    token = create_auth_token(test_user.id, [secondary_site.id])
+    token = token_for(user_with_site.id, (secondary_site.id,))
     
     # Make a request to get all interactions with the token
     response = client.get(
@@ -53,22 +74,17 @@ def test_site_scoping_blocks_unauthorized_site_access(client, db_session, test_u
     assert response.status_code == 403
     
     # Verify the error message indicates site access is forbidden
-    data = json.loads(response.data)
+    data = response.get_json()
     assert "error" in data
     assert "forbidden" in data["error"]["message"].lower()
 
 
 @pytest.mark.integration
-def test_interaction_creation_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site):
+def test_interaction_creation_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site, token_for):
     """Test that creating an interaction enforces site-scoping rules."""
     # Create interaction data for the authorized site
     interaction_data = {
-        "title": "Test Interaction",
-        "type": "Meeting",
-        "lead": "John Doe",
-        "start_datetime": datetime.datetime.now().isoformat(),
-        "end_datetime": (datetime.datetime.now() + datetime.timedelta(hours=1)).isoformat(),
-        "timezone": "America/New_York",
+        **BASE_INTERACTION_PAYLOAD,
         "location": "Conference Room A",
         "description": "Test description",
         "notes": "Test notes",
@@ -76,7 +92,7 @@ def test_interaction_creation_enforces_site_scoping(client, db_session, user_wit
     }
     
     # Create a JWT token with user's site ID
-    token = create_auth_token(user_with_site.id, [test_site.id])
+    token = token_for(user_with_site.id, (test_site.id,))
     
     # Make a POST request to create an interaction
     response = client.post(
@@ -103,19 +119,10 @@ def test_interaction_creation_enforces_site_scoping(client, db_session, user_wit
 
 
 @pytest.mark.integration
-def test_interaction_retrieval_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site):
-    """Test that retrieving interactions enforces site-scoping rules."""
-    # Create an interaction for the test_site
-    interaction1 = InteractionFactory(site=test_site, created_by=user_with_site.id)
-    
-    # Create an interaction for the secondary_site
-    interaction2 = InteractionFactory(site=secondary_site, created_by=user_with_site.id)
-    
-    # Commit to the database
-    db_session.commit()
-    
+def test_interaction_list_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site, two_interactions, token_for):
+    """Test that listing interactions only returns those from the authorized site."""
     # Create a JWT token with user's site ID (test_site)
-    token = create_auth_token(user_with_site.id, [test_site.id])
+    token = token_for(user_with_site.id, (test_site.id,))
     
     # Make a GET request to get all interactions
     response = client.get(
@@ -125,151 +132,83 @@ def test_interaction_retrieval_enforces_site_scoping(client, db_session, user_wi
     
     # Verify we only get interactions from the authorized site
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     
     # Check that we have interactions and they're all from the authorized site
     assert "interactions" in data
     assert len(data["interactions"]) > 0
-    for interaction in data["interactions"]:
-        assert interaction["site_id"] == test_site.id
-    
-    # Make a GET request to get the specific interaction from secondary_site
-    response = client.get(
-        f"/api/interactions/{interaction2.id}",
-        headers={"Authorization": f"Bearer {token}"}
-    )
-    
-    # Verify the request is forbidden (404 not found)
-    assert response.status_code == 404
+    assert {i["site_id"] for i in data["interactions"]} <= {test_site.id}
 
 
 @pytest.mark.integration
-def test_interaction_update_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site):
-    """Test that updating interactions enforces site-scoping rules."""
-    # Create an interaction for the test_site
-    interaction1 = InteractionFactory(site=test_site, created_by=user_with_site.id)
-    
-    # Create an interaction for the secondary_site
-    interaction2 = InteractionFactory(site=secondary_site, created_by=user_with_site.id)
-    
-    # Commit to the database
-    db_session.commit()
+@pytest.mark.parametrize("method,extra", [
+    ("get", {}),
+    ("put", {"json": {**BASE_INTERACTION_PAYLOAD, "title": "Updated Interaction"}}),
+    ("delete", {})
+])
+def test_interaction_access_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site, two_interactions, token_for, method, extra):
+    """Test that retrieving, updating and deleting a single interaction enforces site-scoping rules."""
+    interaction1, interaction2 = two_interactions
     
     # Create a JWT token with user's site ID (test_site)
-    token = create_auth_token(user_with_site.id, [test_site.id])
-    
-    # Make a PUT request to update the interaction from test_site
-    update_data = {
-        "title": "Updated Interaction",
-        "type": "Meeting",
-        "lead": "John Doe",
-        "start_datetime": datetime.datetime.now().isoformat(),
-        "end_datetime": (datetime.datetime.now() + datetime.timedelta(hours=1)).isoformat(),
-        "timezone": "America/New_York"
-    }
-    
-    response = client.put(
-        f"/api/interactions/{interaction1.id}",
-        json=update_data,
-        headers={"Authorization": f"Bearer {token}"}
-    )
+    token = token_for(user_with_site.id, (test_site.id,))
+    headers = {"Authorization": f"Bearer {token}"}
+    request = getattr(client, method)
     
-    # Verify the update is successful (200)
+    # The interaction on the authorized site is accessible
+    response = request(f"/api/interactions/{interaction1.id}", headers=headers, **extra)
     assert response.status_code == 200
     
-    # Make a PUT request to update the interaction from secondary_site
-    response = client.put(
-        f"/api/interactions/{interaction2.id}",
-        json=update_data,
-        headers={"Authorization": f"Bearer {token}"}
-    )
-    
-    # Verify the update is forbidden (404 not found)
-    assert response.status_code == 404
-
-
-@pytest.mark.integration
-def test_interaction_deletion_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site):
-    """Test that deleting interactions enforces site-scoping rules."""
-    # Create an interaction for the test_site
-    interaction1 = InteractionFactory(site=test_site, created_by=user_with_site.id)
-    
-    # Create an interaction for the secondary_site
-    interaction2 = InteractionFactory(site=secondary_site, created_by=user_with_site.id)
-    
-    # Commit to the database
-    db_session.commit()
-    
-    # Create a JWT token with user's site ID (test_site)
-    token = create_auth_token(user_with_site.id, [test_site.id])
-    
-    # Make a DELETE request to delete the interaction from test_site
-    response = client.delete(
-        f"/api/interactions/{interaction1.id}",
-        headers={"Authorization": f"Bearer {token}"}
-    )
-    
-    # Verify the deletion is successful (200)
-    assert response.status_code == 200
-    
-    # Make a DELETE request to delete the interaction from secondary_site
-    response = client.delete(
-        f"/api/interactions/{interaction2.id}",
-        headers={"Authorization": f"Bearer {token}"}
-    )
-    
-    # Verify the deletion is forbidden (404 not found)
+    # The interaction on the other site is hidden (404 not found)
+    response = request(f"/api/interactions/{interaction2.id}", headers=headers, **extra)
     assert response.status_code == 404
 
 
 @pytest.mark.integration
-def test_search_interactions_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site):
+def test_search_interactions_enforces_site_scoping(client, db_session, user_with_site, test_site, secondary_site, token_for):
     """Test that searching interactions enforces site-scoping rules."""
-    # Create multiple interactions for test_site with a specific search term
-    for i in range(3):
-        InteractionFactory(
-            site=test_site,
-            created_by=user_with_site.id,
-            title=f"Searchable Meeting {i}",
-            type="Meeting"
-        )
-    
-    # Create multiple interactions for secondary_site with the same search term
-    for i in range(3):
-        InteractionFactory(
-            site=secondary_site,
-            created_by=user_with_site.id,
-            title=f"Searchable Meeting {i}",
-            type="Meeting"
-        )
+    # Insert three interactions per site sharing the same search term in one batch
+    common = {
+        "created_by": user_with_site.id,
+        "type": "Meeting",
+        "lead": "John Doe",
+        "start_datetime": _BASE_TIME,
+        "end_datetime": _BASE_TIME + datetime.timedelta(hours=1),
+        "timezone": "America/New_York"
+    }
+    db_session.bulk_insert_mappings(Interaction, [
+        {**common, "site_id": site.site_id, "title": f"Searchable Meeting {i}"}
+        for site in (test_site, secondary_site)
+        for i in range(3)
+    ])
     
     # Commit to the database
     db_session.commit()
     
     # Create a JWT token with user's site ID (test_site)
-    token = create_auth_token(user_with_site.id, [test_site.id])
+    token = token_for(user_with_site.id, (test_site.id,))
     
     # Make a GET request to search interactions with the search term
     response = client.get(
-        "/api/interactions?search=Searchable",
+        "/api/interactions?search=Searchable&page_size=1",
         headers={"Authorization": f"Bearer {token}"}
     )
     
     # Verify we only get interactions from the authorized site
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     
     # Check that we have interactions and they're all from the authorized site
     assert "interactions" in data
     assert "total" in data
     assert data["total"] == 3  # Only the 3 from test_site
-    for interaction in data["interactions"]:
-        assert interaction["site_id"] == test_site.id
-        assert "Searchable Meeting" in interaction["title"]
+    assert len(data["interactions"]) == 1
+    assert {i["site_id"] for i in data["interactions"]} <= {test_site.id}
+    assert "Searchable Meeting" in data["interactions"][0]["title"]
 
 
 @pytest.mark.integration
-def test_user_with_multiple_sites_can_switch_context(client, db_session, user_with_multiple_sites, test_site, secondary_site):
+def test_user_with_multiple_sites_can_switch_context(client, db_session, user_with_multiple_sites, test_site, secondary_site, token_for):
     """Test that users with multiple site associations can switch site context."""
     # Create interactions for both test_site and secondary_site
     interaction1 = InteractionFactory(site=test_site, created_by=user_with_multiple_sites.id)
@@ -279,7 +218,7 @@ def test_user_with_multiple_sites_can_switch_context(client, db_session, user_wi
     db_session.commit()
     
     # Create a JWT token with both site IDs in the available_sites claim
-    token = create_auth_token(user_with_multiple_sites.id, [test_site.id, secondary_site.id])
+    token = token_for(user_with_multiple_sites.id, (test_site.id, secondary_site.id))
     
     # Make a GET request with test_site as the active site context
     response = client.get(
@@ -292,12 +231,11 @@ def test_user_with_multiple_sites_can_switch_context(client, db_session, user_wi
     
     # Verify we only get interactions from test_site
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     
     assert "interactions" in data
     assert data["site_context"]["id"] == test_site.id
-    for interaction in data["interactions"]:
-        assert interaction["site_id"] == test_site.id
+    assert {i["site_id"] for i in data["interactions"]} <= {test_site.id}
     
     # Make another GET request with secondary_site as the active site context
     response = client.get(
@@ -310,61 +248,48 @@ def test_user_with_multiple_sites_can_switch_context(client, db_session, user_wi
     
     # Verify we only get interactions from secondary_site
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     
     assert "interactions" in data
     assert data["site_context"]["id"] == secondary_site.id
-    for interaction in data["interactions"]:
-        assert interaction["site_id"] == secondary_site.id
+    assert {i["site_id"] for i in data["interactions"]} <= {secondary_site.id}
     
     # Verify the site context switch was successful
     assert data["site_context"]["available_sites"] == [test_site.id, secondary_site.id]
 
 
 @pytest.mark.integration
-def test_site_scoping_at_service_layer(client, db_session, app, user_with_site, test_site, secondary_site):
+def test_site_scoping_at_service_layer(client, db_session, app, user_with_site, test_site, secondary_site, two_interactions, interaction_service):
     """Test that site-scoping is enforced at the service layer directly."""
-    # Create an interaction for each site
-    interaction1 = InteractionFactory(site=test_site, created_by=user_with_site.id)
-    interaction2 = InteractionFactory(site=secondary_site, created_by=user_with_site.id)
-    
-    # Commit to the database
-    db_session.commit()
-    
-    # Get the InteractionService instance from the application
-    from ...interactions.services import InteractionService
-    service = InteractionService()
+    # One interaction on each site, created by the two_interactions fixture
+    interaction1, interaction2 = two_interactions
     
     # Set up the Flask g context with site_context
     with app.test_request_context():
         g.site_context = {"id": test_site.id, "available_sites": [test_site.id]}
         
         # Try to access interaction from the authorized site - should succeed
-        interaction = service.get_interaction_by_id(interaction1.id)
+        interaction = interaction_service.get_interaction_by_id(interaction1.id)
         assert interaction is not None
         assert interaction.site_id == test_site.id
         
         # Try to access interaction from the unauthorized site - should raise AuthorizationError
         with pytest.raises(AuthorizationError):
-            service.get_interaction_by_id(interaction2.id)
+            interaction_service.get_interaction_by_id(interaction2.id)
 
 
 @pytest.mark.integration
-def test_middleware_sets_site_context_in_flask_g(client, db_session, user_with_site, test_site, app):
+def test_middleware_sets_site_context_in_flask_g(client, db_session, user_with_site, test_site, app, token_for):
     """Test that the auth middleware correctly sets site context in Flask g object."""
     # Create a JWT token with user's site ID
-    token = create_auth_token(user_with_site.id, [test_site.id])
+    token = token_for(user_with_site.id, (test_site.id,))
     
     # Create a Flask context with the auth token
-    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
-        # Trigger the auth middleware by making a request
-        client.get(
-            "/api/interactions",
-            headers={"Authorization": f"Bearer {token}"}
-        )
+    with app.test_request_context("/api/interactions", headers={"Authorization": f"Bearer {token}"}):
+        # Run the auth middleware directly against this request context
+        auth_middleware()
         
         # Verify that flask.g contains the expected site_context
-        from flask import g
         assert hasattr(g, "site_context")
         assert g.site_context is not None
         
@@ -0,0 +1,40 @@
+"""
+Pytest fixtures specific to the unit test suite.
+"""
+
+import functools
+import pytest
+
+from src.backend.utils.security import hash_password
+from src.backend.tests.conftest import TEST_PASSWORD
+from src.backend.tests.factories import UserFactory
+
+
+@pytest.fixture(scope='session')
+def password_hash_for():
+    """
+    Fixture that provides a memoized password hasher for the test session.
+    
+    bcrypt output is salted but any hash verifies against its password, so one hash
+    per distinct password is enough for the whole session.
+    
+    Returns:
+        Callable taking a plain-text password and returning its bcrypt hash
+    """
+    return functools.lru_cache(maxsize=None)(hash_password)
+
+
+@pytest.fixture
+def testuser_with_hash(password_hash_for):
+    """
+    Fixture that builds an unsaved "testuser" whose password is TEST_PASSWORD.
+    
+    Args:
+        password_hash_for: Memoized password hasher fixture
+    
+    Returns:
+        User model instance (not persisted)
+    """
+    user = UserFactory.build(username="testuser")
+    user.password_hash = password_hash_for(TEST_PASSWORD)
+    return user
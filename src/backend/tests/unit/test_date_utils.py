@@ -0,0 +1,140 @@
+"""
+Unit tests for the date utilities module.
+"""
+
+import importlib
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import column
+
+from src.backend.utils import date_utils
+from src.backend.utils.date_utils import (
+    DATE_FORMAT, DATETIME_FORMAT, DISPLAY_DATETIME_FORMAT, convert_timezone,
+    get_date_range_filter, is_valid_timezone, parse_datetime, timezone_to_utc, utc_to_timezone,
+    validate_date_range,
+)
+
+
+def _strptime_or_none(value, format_str):
+    """Returns what datetime.strptime makes of value, or None where it raises."""
+    try:
+        return datetime.strptime(value, format_str)
+    except ValueError:
+        return None
+
+
+def test_date_utils_imports_with_valid_common_timezones():
+    """Test that the module's import-time COMMON_TIMEZONES check passes on a real tz database."""
+    # Re-running the module body repeats the check even if another test imported it first
+    module = importlib.reload(date_utils)
+
+    assert all(module.is_valid_timezone(tz) for tz in module.COMMON_TIMEZONES)
+
+
+@pytest.mark.parametrize("value, format_str", [
+    pytest.param("2023-08-15", DATE_FORMAT, id="date"),
+    pytest.param("2023-8-5", DATE_FORMAT, id="date-single-digits"),
+    pytest.param("2023-01- 5", DATE_FORMAT, id="date-space-padded-day"),
+    pytest.param("2023-02-30", DATE_FORMAT, id="date-out-of-range"),
+    pytest.param("2023-13-01", DATE_FORMAT, id="date-bad-month"),
+    pytest.param("2023-08-15x", DATE_FORMAT, id="date-trailing-text"),
+    pytest.param("2023-08-15T10:30:45", DATETIME_FORMAT, id="datetime"),
+    pytest.param("2023-8-5T1:2:3", DATETIME_FORMAT, id="datetime-single-digits"),
+    pytest.param("2023-08-15t10:30:45", DATETIME_FORMAT, id="datetime-lowercase-t"),
+    pytest.param("2023-08-15T10:30:45Z", DATETIME_FORMAT, id="datetime-trailing-z"),
+    pytest.param("2023-08-15T10:30:45.123456", DATETIME_FORMAT, id="datetime-fraction"),
+    pytest.param("2023-08-15T24:00:00", DATETIME_FORMAT, id="datetime-bad-hour"),
+    pytest.param("2023-08-15T10:30:60", DATETIME_FORMAT, id="datetime-leap-second"),
+    pytest.param("08/15/2023 10:30", DISPLAY_DATETIME_FORMAT, id="display"),
+    pytest.param("8/5/2023 9:05", DISPLAY_DATETIME_FORMAT, id="display-single-digits"),
+    pytest.param("8/15/2023   9:05", DISPLAY_DATETIME_FORMAT, id="display-extra-spaces"),
+    pytest.param("08/15/23 10:30", DISPLAY_DATETIME_FORMAT, id="display-short-year"),
+    pytest.param("not a date", DATETIME_FORMAT, id="garbage"),
+])
+def test_parse_datetime_matches_strptime(value, format_str):
+    """Test that the precompiled fast path accepts and rejects exactly what strptime does."""
+    assert parse_datetime(value, format_str) == _strptime_or_none(value, format_str)
+
+
+@pytest.mark.parametrize("value, expected", [
+    pytest.param("2023-08-15T10:30:00", datetime(2023, 8, 15, 10, 30), id="iso"),
+    pytest.param(
+        "2023-08-15T10:30:00Z", datetime(2023, 8, 15, 10, 30, tzinfo=timezone.utc), id="iso-z"
+    ),
+    pytest.param("2023-08-15 10:30:00.250000", datetime(2023, 8, 15, 10, 30, 0, 250000),
+                 id="iso-fraction"),
+    pytest.param("August 15, 2023 10:30", datetime(2023, 8, 15, 10, 30), id="dateutil-fallback"),
+    pytest.param("not a date", None, id="garbage"),
+    pytest.param("", None, id="empty"),
+])
+def test_parse_datetime_without_format(value, expected):
+    """Test that ISO input parses via fromisoformat and anything else falls back to dateutil."""
+    assert parse_datetime(value) == expected
+
+
+def test_get_date_range_filter_closed_range_uses_between():
+    """Test that a range with both bounds becomes a single BETWEEN condition."""
+    conditions = get_date_range_filter(datetime(2023, 1, 1), datetime(2023, 1, 31),
+                                       column("start_datetime"))
+
+    assert len(conditions) == 1
+    assert "BETWEEN" in str(conditions[0])
+
+
+@pytest.mark.parametrize("start, end, operator", [
+    pytest.param(datetime(2023, 1, 1), None, ">=", id="start-only"),
+    pytest.param(None, datetime(2023, 1, 31), "<=", id="end-only"),
+])
+def test_get_date_range_filter_open_range(start, end, operator):
+    """Test that a range with one bound becomes a single comparison."""
+    conditions = get_date_range_filter(start, end, column("start_datetime"))
+
+    assert len(conditions) == 1
+    assert operator in str(conditions[0])
+
+
+def test_get_date_range_filter_without_bounds():
+    """Test that a range with no bounds adds no conditions."""
+    assert get_date_range_filter(None, None, column("start_datetime")) == ()
+
+
+@pytest.mark.parametrize("local, expected_utc_hour", [
+    pytest.param(datetime(2023, 7, 1, 12, 0), 16, id="daylight-time"),
+    pytest.param(datetime(2023, 1, 1, 12, 0), 17, id="standard-time"),
+])
+def test_convert_timezone_treats_naive_as_source(local, expected_utc_hour):
+    """Test that naive datetimes are read in the source zone, with DST applied."""
+    converted = convert_timezone(local, "America/New_York", "UTC")
+
+    assert converted == datetime(2023, local.month, 1, expected_utc_hour, tzinfo=timezone.utc)
+
+
+def test_utc_round_trip():
+    """Test that utc_to_timezone and timezone_to_utc invert each other."""
+    utc = datetime(2023, 7, 1, 16, 0)
+
+    local = utc_to_timezone(utc, "America/New_York")
+
+    assert (local.hour, str(local.tzinfo)) == (12, "America/New_York")
+    assert timezone_to_utc(local.replace(tzinfo=None), "America/New_York") == utc.replace(
+        tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.parametrize("name", ["Not/AZone", "", None, 42])
+def test_invalid_timezones_are_rejected(name):
+    """Test that unknown, malformed and non-string timezone names fail cleanly."""
+    assert is_valid_timezone(name) is False
+    assert convert_timezone(datetime(2023, 1, 1), "UTC", name) is None
+    assert utc_to_timezone(datetime(2023, 1, 1), name) is None
+
+
+def test_validate_date_range_compares_in_timezone():
+    """Test that a naive start and an aware end are compared in the given timezone."""
+    start = datetime(2023, 7, 1, 12, 0)
+    end = datetime(2023, 7, 1, 15, 30, tzinfo=timezone.utc)
+
+    # 12:00 in New York is 16:00 UTC, so the range ends before it starts
+    assert validate_date_range(start, end, "America/New_York") is False
+    assert validate_date_range(start, end.replace(hour=16), "America/New_York") is True
@@ -2,45 +2,89 @@
 Unit tests for the interactions module, covering models, services, repositories, and controllers.
 """
 
+import bleach
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
-from freezegun import freeze_time
+import time_machine
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, DEFAULT
 
 from src.backend.interactions.services import InteractionService
 from src.backend.interactions.repositories import InteractionRepository
 from src.backend.interactions.schemas import InteractionCreateSchema, InteractionUpdateSchema, InteractionResponseSchema
-from src.backend.interactions.controllers import InteractionController
-from src.backend.utils.validators import ValidationError
-from src.backend.utils.date_utils import date_to_iso
+from src.backend.interactions.controllers import create_interaction, get_interaction
+from src.backend.api.error_handlers import ResourceNotFoundError
+from src.backend.utils.validators import (
+    ValidationError, sanitize_search_term, validate_interaction_type, validate_interactions_batch,
+)
+
+# Valid interaction payload shared by fixtures and parametrized cases
+VALID_INTERACTION_DATA = {
+    'title': 'Test Interaction',
+    'type': 'Meeting',
+    'lead': 'John Doe',
+    'start_datetime': datetime(2023, 8, 15, 10, 0, 0),
+    'timezone': 'America/New_York',
+    'end_datetime': datetime(2023, 8, 15, 11, 0, 0),
+    'location': 'Conference Room A',
+    'description': 'Test description',
+    'notes': 'Test notes'
+}
+
+# Search filters exercised by the paginated search cases
+FULL_SEARCH_CRITERIA = {
+    'title': 'Test',
+    'type': 'Meeting',
+    'lead': 'John',
+    'start_datetime': date(2023, 8, 15),
+    'end_datetime': date(2023, 8, 22)
+}
+
+# Paging arguments the service passes to the repository when none are given
+_DEFAULT_PAGING = dict(page=1, page_size=25, sort_field='created_at', sort_direction='desc')
+
+@dataclass(slots=True)
+class _Paginated:
+    """Plain stand-in for the repository's paginated result; nothing asserts calls on it."""
+    items: list
+    total: int
+    page: int = 1
+    page_size: int = 25
+
+# Schema instances are stateless between validate() calls, so build one for the module
+_CREATE_SCHEMA = InteractionCreateSchema()
 
 # Test fixtures
-@pytest.fixture
-def mock_repository():
-    """Returns a mock repository for testing services."""
+# Everything here is mock-backed with no DB or filesystem state, so the module runs under
+# pytest -n auto without an xdist_group: session fixtures are built once per worker and
+# time_machine.travel only patches the clock for the duration of the decorated test.
+@pytest.fixture(scope="session")
+def _repo_template():
+    """Builds the spec'd repository mock once; spec introspection is the expensive part."""
     return Mock(spec=InteractionRepository)
 
 @pytest.fixture
-def interaction_service(mock_repository):
-    """Returns an interaction service with a mock repository."""
-    service = InteractionService()
-    service.repository = mock_repository
-    return service
+def mock_repository(_repo_template):
+    """Returns a mock repository for testing services, reset to a clean state."""
+    _repo_template.reset_mock(return_value=True, side_effect=True)
+    return _repo_template
+
+@pytest.fixture(scope="session")
+def _service():
+    """Builds the InteractionService once; tests only ever swap its repository."""
+    return InteractionService()
 
 @pytest.fixture
+def interaction_service(_service, mock_repository):
+    """Returns an interaction service with a mock repository."""
+    _service.repository = mock_repository
+    return _service
+
+@pytest.fixture(scope="module")
 def valid_interaction_data():
-    """Returns valid interaction data for testing."""
-    return {
-        'title': 'Test Interaction',
-        'type': 'Meeting',
-        'lead': 'John Doe',
-        'start_datetime': datetime.now(),
-        'timezone': 'America/New_York',
-        'end_datetime': datetime.now() + timedelta(hours=1),
-        'location': 'Conference Room A',
-        'description': 'Test description',
-        'notes': 'Test notes'
-    }
+    """Returns valid interaction data for testing; shared by the module, so copy before mutating."""
+    return dict(VALID_INTERACTION_DATA)
 
 @pytest.fixture
 def invalid_interaction_data():
@@ -49,7 +93,7 @@ def invalid_interaction_data():
         'title': '',  # Empty title
         'type': 'Invalid Type',  # Invalid type
         'lead': 'John Doe',
-        'start_datetime': datetime.now(),
+        'start_datetime': datetime(2023, 8, 15, 10, 0, 0),
         'timezone': 'Invalid/Timezone',  # Invalid timezone
     }
 
@@ -59,19 +103,21 @@ def test_create_interaction(interaction_service, mock_repository, valid_interact
     # Set up mock repository
     site_id = 1
     user_id = 1
-    mock_interaction = Mock(interaction_id=1, **valid_interaction_data)
+    mock_interaction = SimpleNamespace(interaction_id=1, **valid_interaction_data)
     mock_repository.create.return_value = mock_interaction
     
     # Call service create method
     result = interaction_service.create(valid_interaction_data, site_id, user_id)
     
-    # Assert repository create was called with correct data
-    mock_repository.create.assert_called_once_with(valid_interaction_data, site_id, user_id)
+    # Assert repository create was called once with the same payload object
+    assert mock_repository.create.call_count == 1
+    args, _ = mock_repository.create.call_args
+    assert args[0] is valid_interaction_data
+    assert args[1:] == (site_id, user_id)
     
     # Assert response contains expected data
     assert result.interaction_id == 1
-    for key, value in valid_interaction_data.items():
-        assert getattr(result, key) == value
+    assert {key: getattr(result, key) for key in valid_interaction_data} == valid_interaction_data
 
 def test_create_interaction_with_invalid_data(interaction_service, mock_repository, invalid_interaction_data):
     """Tests validation errors when creating interaction with invalid data."""
@@ -97,12 +143,12 @@ def test_create_interaction_with_end_before_start(interaction_service, mock_repo
     user_id = 1
     
     # Create interaction data with end_datetime before start_datetime
-    valid_interaction_data['start_datetime'] = datetime.now()
-    valid_interaction_data['end_datetime'] = valid_interaction_data['start_datetime'] - timedelta(hours=1)
+    data = dict(valid_interaction_data)
+    data['end_datetime'] = data['start_datetime'] - timedelta(hours=1)
     
     # Call service create method
     with pytest.raises(ValidationError) as excinfo:
-        interaction_service.create(valid_interaction_data, site_id, user_id)
+        interaction_service.create(data, site_id, user_id)
     
     # Assert ValidationError is raised with appropriate message
     assert 'end_datetime' in excinfo.value.errors
@@ -120,7 +166,7 @@ def test_update_interaction(interaction_service, mock_repository, valid_interact
     allowed_site_ids = [site_id]
     update_data = {'title': 'Updated Title', 'notes': 'Updated notes'}
     
-    updated_interaction = Mock(
+    updated_interaction = SimpleNamespace(
         interaction_id=interaction_id,
         title='Updated Title',
         notes='Updated notes',
@@ -180,7 +226,7 @@ def test_get_interaction_by_id(interaction_service, mock_repository, valid_inter
     site_id = 1
     allowed_site_ids = [site_id]
     
-    mock_interaction = Mock(interaction_id=interaction_id, **valid_interaction_data)
+    mock_interaction = SimpleNamespace(interaction_id=interaction_id, **valid_interaction_data)
     mock_repository.get_by_id.return_value = mock_interaction
     
     # Call service get_by_id method
@@ -200,7 +246,7 @@ def test_get_interaction_with_site_context(interaction_service, mock_repository,
     invalid_site_id = 2
     
     # Create test interaction with site_id
-    mock_interaction = Mock(interaction_id=interaction_id, site_id=valid_site_id, **valid_interaction_data)
+    mock_interaction = SimpleNamespace(interaction_id=interaction_id, site_id=valid_site_id, **valid_interaction_data)
     
     def mock_get_by_id(id, allowed_sites):
         if valid_site_id in allowed_sites:
@@ -217,159 +263,40 @@ def test_get_interaction_with_site_context(interaction_service, mock_repository,
     with pytest.raises(ResourceNotFoundError):
         interaction_service.get_by_id(interaction_id, invalid_site_id)
 
-def test_list_interactions(interaction_service, mock_repository):
-    """Tests listing all interactions."""
-    # Set up mock repository to return list of interactions
+@pytest.mark.parametrize("method,call_args,repo_kwargs", [
+    ("get_all", (), {}),
+    ("search", ({'title': 'Test'},), {'filters': {'title': 'Test'}}),
+    ("search", (FULL_SEARCH_CRITERIA,), {'filters': FULL_SEARCH_CRITERIA}),
+], ids=["list", "search_title", "search_all_criteria"])
+def test_paginated_interactions(interaction_service, mock_repository, method, call_args, repo_kwargs):
+    """Tests site-scoped listing and searching of interactions."""
+    # Set up mock repository to return a page of interactions
     site_id = 1
     allowed_site_ids = [site_id]
     
     interactions = [
-        {'interaction_id': 1, 'title': 'First Interaction', 'site_id': site_id},
+        {'interaction_id': 1, 'title': 'Test Meeting', 'site_id': site_id},
         {'interaction_id': 2, 'title': 'Second Interaction', 'site_id': site_id}
     ]
     
-    mock_paginated_result = Mock(
-        items=interactions,
-        total=2,
-        page=1,
-        page_size=25
-    )
-    mock_repository.get_all.return_value = mock_paginated_result
+    getattr(mock_repository, method).return_value = _Paginated(items=interactions, total=2)
     
-    # Call service list method
-    result = interaction_service.get_all(site_id)
+    # Call the service method with the site context
+    result = getattr(interaction_service, method)(site_id, *call_args)
     
-    # Assert repository list was called
-    mock_repository.get_all.assert_called_once_with(
+    # Assert repository was called with the site filter and default paging
+    getattr(mock_repository, method).assert_called_once_with(
         allowed_site_ids,
-        page=1,
-        page_size=25,
-        sort_field='created_at',
-        sort_direction='desc'
-    )
-    
-    # Assert returned list matches expected interactions
-    assert result.items == interactions
-    assert result.total == 2
-
-def test_list_interactions_with_site_context(interaction_service, mock_repository):
-    """Tests site-scoped access when listing interactions."""
-    # Set up mock repository
-    site_id = 1
-    allowed_site_ids = [site_id]
-    
-    interactions = [
-        {'interaction_id': 1, 'title': 'First Interaction', 'site_id': site_id},
-        {'interaction_id': 2, 'title': 'Second Interaction', 'site_id': site_id}
-    ]
-    
-    mock_paginated_result = Mock(
-        items=interactions,
-        total=2,
-        page=1,
-        page_size=25
-    )
-    mock_repository.get_all.return_value = mock_paginated_result
-    
-    # Call service list method with site context
-    result = interaction_service.get_all(site_id)
-    
-    # Assert repository list was called with site_id filter
-    mock_repository.get_all.assert_called_once_with(
-        allowed_site_ids,
-        page=1,
-        page_size=25,
-        sort_field='created_at',
-        sort_direction='desc'
+        **repo_kwargs,
+        **_DEFAULT_PAGING
     )
     
     # Assert only interactions from specified site are returned
     assert result.items == interactions
+    assert result.total == 2
     assert all(item['site_id'] == site_id for item in result.items)
 
-def test_search_interactions(interaction_service, mock_repository):
-    """Tests searching interactions with various criteria."""
-    # Set up mock repository to return search results
-    site_id = 1
-    allowed_site_ids = [site_id]
-    
-    # Define search criteria (title, type, lead, date range)
-    search_criteria = {
-        'title': 'Test',
-        'type': 'Meeting',
-        'lead': 'John',
-        'start_datetime': datetime.now().date(),
-        'end_datetime': (datetime.now() + timedelta(days=7)).date()
-    }
-    
-    search_results = [
-        {'interaction_id': 1, 'title': 'Test Meeting', 'type': 'Meeting', 'lead': 'John Doe', 'site_id': site_id}
-    ]
-    
-    mock_paginated_result = Mock(
-        items=search_results,
-        total=1,
-        page=1,
-        page_size=25
-    )
-    mock_repository.search.return_value = mock_paginated_result
-    
-    # Call service search method with criteria
-    result = interaction_service.search(site_id, search_criteria)
-    
-    # Assert repository search was called with correct parameters
-    mock_repository.search.assert_called_once_with(
-        allowed_site_ids,
-        filters=search_criteria,
-        page=1,
-        page_size=25,
-        sort_field='created_at',
-        sort_direction='desc'
-    )
-    
-    # Assert returned results match expected interactions
-    assert result.items == search_results
-    assert result.total == 1
-
-def test_search_interactions_with_site_context(interaction_service, mock_repository):
-    """Tests site-scoped access when searching interactions."""
-    # Set up mock repository
-    site_id = 1
-    allowed_site_ids = [site_id]
-    
-    # Define search criteria
-    search_criteria = {'title': 'Test'}
-    
-    search_results = [
-        {'interaction_id': 1, 'title': 'Test Meeting', 'site_id': site_id}
-    ]
-    
-    mock_paginated_result = Mock(
-        items=search_results,
-        total=1,
-        page=1,
-        page_size=25
-    )
-    mock_repository.search.return_value = mock_paginated_result
-    
-    # Call service search method with criteria and site context
-    result = interaction_service.search(site_id, search_criteria)
-    
-    # Assert repository search includes site_id filter
-    mock_repository.search.assert_called_once_with(
-        allowed_site_ids,
-        filters=search_criteria,
-        page=1,
-        page_size=25,
-        sort_field='created_at',
-        sort_direction='desc'
-    )
-    
-    # Assert only interactions from specified site are returned
-    assert result.items == search_results
-    assert all(item['site_id'] == site_id for item in result.items)
-
-@pytest.mark.freeze_time('2023-08-15T10:00:00Z')
+@time_machine.travel('2023-08-15T10:00:00Z', tick=False)
 def test_interaction_date_handling(interaction_service, mock_repository):
     """Tests correct handling of dates and timezones in interactions."""
     # Create interaction with specific timezone
@@ -386,7 +313,7 @@ def test_interaction_date_handling(interaction_service, mock_repository):
     }
     
     # Set up mock repository
-    mock_interaction = Mock(interaction_id=1, **interaction_data)
+    mock_interaction = SimpleNamespace(interaction_id=1, **interaction_data)
     mock_repository.create.return_value = mock_interaction
     
     # Call service create method
@@ -401,62 +328,92 @@ def test_interaction_date_handling(interaction_service, mock_repository):
     mock_repository.create.assert_called_once_with(interaction_data, site_id, user_id)
 
 def test_interaction_schema_validation():
-    """Tests validation rules in InteractionSchema."""
-    # Create test cases with valid and invalid data
-    valid_data = {
-        'title': 'Test Interaction',
-        'type': 'Meeting',
-        'lead': 'John Doe',
-        'start_datetime': datetime(2023, 8, 15, 10, 0, 0),
-        'timezone': 'America/New_York',
-        'end_datetime': datetime(2023, 8, 15, 11, 0, 0),
-        'location': 'Conference Room A',
-        'description': 'Test description',
-        'notes': 'Test notes'
-    }
-    
-    # Instantiate InteractionSchema
-    create_schema = InteractionCreateSchema()
-    
-    # Test valid data passes validation
+    """Tests that valid data passes InteractionCreateSchema validation."""
     try:
-        create_schema.validate(valid_data)
+        _CREATE_SCHEMA.validate(VALID_INTERACTION_DATA)
     except ValidationError:
         pytest.fail("Valid data failed validation")
-    
-    # Test various invalid data cases (missing fields, invalid types)
-    with pytest.raises(ValidationError):
-        create_schema.validate({'title': 'Missing Required Fields'})
-        
-    with pytest.raises(ValidationError):
-        create_schema.validate({**valid_data, 'type': 'InvalidType'})
-        
-    with pytest.raises(ValidationError):
-        create_schema.validate({**valid_data, 'timezone': 'Invalid/Timezone'})
-        
-    with pytest.raises(ValidationError):
-        create_schema.validate({
-            **valid_data,
-            'start_datetime': datetime(2023, 8, 15, 11, 0, 0),
-            'end_datetime': datetime(2023, 8, 15, 10, 0, 0)  # End before start
-        })
+
+@pytest.mark.parametrize("data,expected_keys", [
+    pytest.param({'title': 'Missing Required Fields'}, ('type', 'lead', 'start_datetime', 'timezone'),
+                 id="missing_fields"),
+    pytest.param({**VALID_INTERACTION_DATA, 'type': 'InvalidType'}, ('type',), id="invalid_type"),
+    pytest.param({**VALID_INTERACTION_DATA, 'timezone': 'Invalid/Timezone'}, ('timezone',), id="invalid_timezone"),
+    pytest.param({
+        **VALID_INTERACTION_DATA,
+        'start_datetime': datetime(2023, 8, 15, 11, 0, 0),
+        'end_datetime': datetime(2023, 8, 15, 10, 0, 0)  # End before start
+    }, (), id="end_before_start"),
+])
+def test_interaction_schema_validation_errors(data, expected_keys):
+    """Tests validation errors raised by InteractionCreateSchema."""
+    with pytest.raises(ValidationError) as excinfo:
+        _CREATE_SCHEMA.validate(data)
     
     # Assert appropriate validation errors are raised
-    try:
-        create_schema.validate({'title': 'Missing Required Fields'})
-    except ValidationError as e:
-        assert 'type' in e.errors
-        assert 'lead' in e.errors
-        assert 'start_datetime' in e.errors
-        assert 'timezone' in e.errors
-
-@patch('src.backend.interactions.controllers.create_schema')
-@patch('src.backend.interactions.controllers.interaction_service')
-@patch('src.backend.interactions.controllers.jsonify')
-def test_interaction_controller_create(mock_jsonify, mock_service, mock_schema):
+    assert set(expected_keys) <= excinfo.value.errors.keys()
+
+@pytest.mark.parametrize("raw", [
+    "  quarterly review  ",
+    "<script>alert(1)</script>budget",
+    "<b>bold</b> <i>italic</i> <div>block</div>",
+    "O'Brien; \"drop\"",
+    "a < b & c > d",
+])
+def test_sanitize_search_term_matches_bleach_clean(raw):
+    """Tests that the shared Cleaner behaves like a per-call bleach.clean."""
+    expected = bleach.clean(raw.strip(), strip=True).translate(str.maketrans('', '', ';"\''))
+    assert sanitize_search_term(raw) == expected
+
+def test_validate_interactions_batch_reports_invalid_records_by_index():
+    """Tests that a mixed batch reports errors only for invalid records, keyed by position."""
+    records = [
+        dict(VALID_INTERACTION_DATA),
+        {**VALID_INTERACTION_DATA, 'title': ''},
+        dict(VALID_INTERACTION_DATA),
+        {**VALID_INTERACTION_DATA, 'type': 'InvalidType', 'timezone': 'Invalid/Timezone'},
+    ]
+    
+    errors = validate_interactions_batch(records)
+    
+    # Valid records at indices 0 and 2 are omitted entirely
+    assert errors.keys() == {1, 3}
+    assert errors[1].keys() == {'title'}
+    assert errors[3].keys() == {'type', 'timezone'}
+    assert validate_interactions_batch(records[::2]) == {}
+
+@pytest.mark.parametrize("type_value", [["Meeting"], {"type": "Meeting"}, 1])
+def test_validate_interaction_type_rejects_non_strings(type_value):
+    """Tests that non-string types from raw records are reported as invalid instead of raising."""
+    assert validate_interaction_type(type_value) is False
+    
+    errors = validate_interactions_batch([{**VALID_INTERACTION_DATA, 'type': type_value}])
+    assert errors[0].keys() == {'type'}
+
+@pytest.fixture
+def controller_patches():
+    """Patches the controller module's collaborators in one pass and yields the mocks by name."""
+    with patch.multiple(
+        'src.backend.interactions.controllers',
+        create_schema=DEFAULT,
+        response_schema=DEFAULT,
+        interaction_service=DEFAULT,
+        jsonify=DEFAULT,
+        format_error_response=DEFAULT,
+        request=DEFAULT,
+        g=DEFAULT
+    ) as mocks:
+        yield mocks
+
+def test_interaction_controller_create(controller_patches):
     """Tests controller layer for creating interactions."""
+    mock_service = controller_patches['interaction_service']
+    mock_schema = controller_patches['create_schema']
+    mock_request = controller_patches['request']
+    mock_g = controller_patches['g']
+    
     # Mock interaction service
-    mock_interaction = Mock(
+    mock_interaction = SimpleNamespace(
         interaction_id=1,
         title='Test Interaction',
         type='Meeting',
@@ -465,44 +422,41 @@ def test_interaction_controller_create(mock_jsonify, mock_service, mock_schema):
     mock_service.create.return_value = mock_interaction
     
     # Create test request data
-    with patch('src.backend.interactions.controllers.request') as mock_request, \
-         patch('src.backend.interactions.controllers.g') as mock_g:
-        mock_request.get_json.return_value = {
-            'title': 'Test Interaction',
-            'type': 'Meeting',
-            'lead': 'John Doe'
-        }
-        mock_request.headers.get.return_value = 'test-request-id'
-        mock_g.site_context = 1
-        mock_g.user = 1
-        
-        mock_schema.load.return_value = {
-            'title': 'Test Interaction',
-            'type': 'Meeting',
-            'lead': 'John Doe'
-        }
-        
-        # Call controller create method
-        from src.backend.interactions.controllers import create_interaction
-        create_interaction()
-        
-        # Assert service create was called with correct data
-        mock_service.create.assert_called_once_with(
-            mock_schema.load.return_value,
-            mock_g.site_context,
-            mock_g.user
-        )
-        
-        # Assert controller returns expected response
-        mock_jsonify.assert_called_once()
-
-@patch('src.backend.interactions.controllers.response_schema')
-@patch('src.backend.interactions.controllers.interaction_service')
-@patch('src.backend.interactions.controllers.jsonify')
-def test_interaction_controller_get(mock_jsonify, mock_service, mock_schema):
+    mock_request.get_json.return_value = {
+        'title': 'Test Interaction',
+        'type': 'Meeting',
+        'lead': 'John Doe'
+    }
+    mock_request.headers.get.return_value = 'test-request-id'
+    mock_g.site_context = 1
+    mock_g.user = 1
+    
+    mock_schema.load.return_value = {
+        'title': 'Test Interaction',
+        'type': 'Meeting',
+        'lead': 'John Doe'
+    }
+    
+    # Call controller create method
+    create_interaction()
+    
+    # Assert service create was called with correct data
+    mock_service.create.assert_called_once_with(
+        mock_schema.load.return_value,
+        mock_g.site_context,
+        mock_g.user
+    )
+    
+    # Assert controller returns expected response
+    controller_patches['jsonify'].assert_called_once()
+
+def test_interaction_controller_get(controller_patches):
     """Tests controller layer for retrieving an interaction."""
+    mock_service = controller_patches['interaction_service']
+    mock_g = controller_patches['g']
+    
     # Mock interaction service to return test interaction
-    mock_interaction = Mock(
+    mock_interaction = SimpleNamespace(
         interaction_id=1,
         title='Test Interaction',
         type='Meeting',
@@ -511,84 +465,79 @@ def test_interaction_controller_get(mock_jsonify, mock_service, mock_schema):
     mock_service.get_by_id.return_value = mock_interaction
     
     # Mock response schema
-    mock_schema.dump.return_value = {
+    controller_patches['response_schema'].dump.return_value = {
         'id': 1,
         'title': 'Test Interaction',
         'type': 'Meeting'
     }
     
     # Call controller get method
-    with patch('src.backend.interactions.controllers.g') as mock_g:
-        mock_g.site_context = 1
-        
-        from src.backend.interactions.controllers import get_interaction
-        get_interaction(1)
-        
-        # Assert service get_by_id was called with correct ID
-        mock_service.get_by_id.assert_called_once_with(1, mock_g.site_context)
-        
-        # Assert controller returns expected response
-        mock_jsonify.assert_called_once()
-
-@patch('src.backend.interactions.controllers.format_error_response')
-@patch('src.backend.interactions.controllers.interaction_service')
-@patch('src.backend.interactions.controllers.jsonify')
-def test_interaction_controller_error_handling(mock_jsonify, mock_service, mock_error_formatter):
+    mock_g.site_context = 1
+    
+    get_interaction(1)
+    
+    # Assert service get_by_id was called with correct ID
+    mock_service.get_by_id.assert_called_once_with(1, mock_g.site_context)
+    
+    # Assert controller returns expected response
+    controller_patches['jsonify'].assert_called_once()
+
+def test_interaction_controller_error_handling(controller_patches):
     """Tests controller error handling for various exceptions."""
+    mock_service = controller_patches['interaction_service']
+    mock_error_formatter = controller_patches['format_error_response']
+    mock_jsonify = controller_patches['jsonify']
+    mock_request = controller_patches['request']
+    mock_g = controller_patches['g']
+    
     # Mock interaction service to raise different exceptions
     validation_error = ValidationError("Validation failed", {"title": "Title is required"})
     mock_service.create.side_effect = validation_error
     
     # Mock format_error_response
     mock_error_formatter.return_value = {"error": {"code": "VALIDATION_ERROR"}}
-    mock_jsonify.return_value = MagicMock()
     
     # Call controller methods and catch responses
-    with patch('src.backend.interactions.controllers.request') as mock_request, \
-         patch('src.backend.interactions.controllers.g') as mock_g:
-        mock_request.get_json.return_value = {}
-        mock_request.headers.get.return_value = 'test-request-id'
-        mock_g.site_context = 1
-        mock_g.user = 1
-        
-        # Test ValidationError
-        from src.backend.interactions.controllers import create_interaction
-        create_interaction()
-        
-        # Assert ValidationError produces 400 response
-        mock_error_formatter.assert_called_with(
-            code="VALIDATION_ERROR",
-            message="Validation failed",
-            request_id='test-request-id',
-            details=[{"field": "title", "message": "Title is required"}]
-        )
-        mock_jsonify.assert_called_with(mock_error_formatter.return_value)
-        
-        # Test NotFound
-        from src.backend.api.error_handlers import ResourceNotFoundError
-        not_found_error = ResourceNotFoundError()
-        mock_service.get_by_id.side_effect = not_found_error
-        mock_error_formatter.return_value = {"error": {"code": "NOT_FOUND"}}
-        
-        from src.backend.interactions.controllers import get_interaction
-        get_interaction(1)
-        
-        # Assert NotFound produces 404 response
-        mock_error_formatter.assert_called_with(
-            code="NOT_FOUND",
-            message="Interaction with id 1 not found",
-            request_id='test-request-id'
-        )
-        
-        # Test other exceptions
-        mock_service.get_by_id.side_effect = Exception("Unexpected error")
-        mock_error_formatter.return_value = {"error": {"code": "INTERNAL_SERVER_ERROR"}}
-        
-        get_interaction(1)
-        
-        # Assert other exceptions produce 500 response
-        mock_error_formatter.assert_called_with(
-            code="INTERNAL_SERVER_ERROR",
-            message="An error occurred while retrieving the interaction",
-            request_id='test-request-id'
-        )
\ No newline at end of file
+    mock_request.get_json.return_value = {}
+    mock_request.headers.get.return_value = 'test-request-id'
+    mock_g.site_context = 1
+    mock_g.user = 1
+    
+    # Test ValidationError
+    create_interaction()
+    
+    # Assert ValidationError produces 400 response
+    mock_error_formatter.assert_called_with(
+        code="VALIDATION_ERROR",
+        message="Validation failed",
+        request_id='test-request-id',
+        details=[{"field": "title", "message": "Title is required"}]
+    )
+    mock_jsonify.assert_called_with(mock_error_formatter.return_value)
+    
+    # Test NotFound
+    not_found_error = ResourceNotFoundError()
+    mock_service.get_by_id.side_effect = not_found_error
+    mock_error_formatter.return_value = {"error": {"code": "NOT_FOUND"}}
+    
+    get_interaction(1)
+    
+    # Assert NotFound produces 404 response
+    mock_error_formatter.assert_called_with(
+        code="NOT_FOUND",
+        message="Interaction with id 1 not found",
+        request_id='test-request-id'
+    )
+    
+    # Test other exceptions
+    mock_service.get_by_id.side_effect = Exception("Unexpected error")
+    mock_error_formatter.return_value = {"error": {"code": "INTERNAL_SERVER_ERROR"}}
+    
+    get_interaction(1)
+    
+    # Assert other exceptions produce 500 response
+    mock_error_formatter.assert_called_with(
+        code="INTERNAL_SERVER_ERROR",
+        message="An error occurred while retrieving the interaction",
+        request_id='test-request-id'
+    )
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Unit tests for the pagination utilities, covering keyset cursors and the Paginator helper.
+"""
+
+import base64
+import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+from src.backend.sites.models import Site
+from src.backend.tests.conftest import make_sites
+from src.backend.utils.pagination import (
+    DEFAULT_PAGE, Paginator, decode_cursor, encode_cursor, get_pagination_params,
+)
+
+
+def _site_query(sites):
+    """Returns a query restricted to the given sites, so the shared base records don't leak in."""
+    return Site.query.filter(Site.site_id.in_([site.site_id for site in sites]))
+
+
+def _keyset_sites(db_session, n):
+    """Inserts n sites sharing two created_at values, so pages also split on the ID tie-breaker."""
+    base = datetime.datetime(2023, 1, 1, 12, 0, 0)
+    sites = make_sites(db_session, n - n // 2, created_at=base + datetime.timedelta(hours=1))
+    sites += make_sites(db_session, n // 2, created_at=base)
+    return sorted(sites, key=lambda site: (site.created_at, site.site_id))
+
+
+@pytest.mark.parametrize("raw, expected", [
+    pytest.param("5", 5, id="plain"),
+    pytest.param(" 5", 5, id="leading-space"),
+    pytest.param("+5", 5, id="plus-sign"),
+    pytest.param("abc", DEFAULT_PAGE, id="not-a-number"),
+    pytest.param("", DEFAULT_PAGE, id="empty"),
+    pytest.param("9" * 5000, DEFAULT_PAGE, id="past-digit-limit"),
+])
+def test_get_pagination_params_page(app, raw, expected):
+    """Test that malformed page values fall back to the default instead of raising."""
+    with app.test_request_context(query_string={"page": raw}):
+        page, _ = get_pagination_params()
+
+    assert page == expected
+
+
+@pytest.mark.parametrize("sort_value, sort_column", [
+    pytest.param(datetime.datetime(2023, 6, 1, 9, 30, 15, 250000), Site.created_at, id="datetime"),
+    pytest.param("Test Site 7", Site.name, id="string"),
+    pytest.param(None, Site.created_at, id="none"),
+])
+def test_cursor_round_trip(sort_value, sort_column):
+    """Test that decode_cursor restores exactly what encode_cursor was given."""
+    cursor = encode_cursor(sort_value, 42)
+
+    assert decode_cursor(cursor, sort_column) == (sort_value, 42)
+
+
+@pytest.mark.parametrize("cursor", [
+    pytest.param("abc", id="bad-padding"),
+    pytest.param("%%%%", id="not-base64"),
+    pytest.param(base64.urlsafe_b64encode(b"not json").decode(), id="not-json"),
+    pytest.param(base64.urlsafe_b64encode(b"[1, 2, 3]").decode(), id="wrong-arity"),
+    pytest.param(base64.urlsafe_b64encode(b"42").decode(), id="not-a-pair"),
+    pytest.param(base64.urlsafe_b64encode(b'["yesterday", 1]').decode(), id="bad-datetime"),
+])
+def test_decode_cursor_malformed(cursor):
+    """Test that every malformed cursor surfaces as the same ValueError."""
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor, Site.created_at)
+
+
+def test_paginate_keyset_traverses_all_pages(db_session):
+    """Test walking a keyset-paginated query page by page returns every row once, in order."""
+    sites = _keyset_sites(db_session, 5)
+    # A pre-existing ORDER BY must be replaced, not extended, or the cursor would skip rows
+    query = _site_query(sites).order_by(Site.name.desc())
+
+    pages = []
+    cursor = None
+    while True:
+        items, cursor = Paginator().paginate_keyset(query, Site.created_at, Site.site_id, cursor, 2)
+        pages.append([site.site_id for site in items])
+        if cursor is None:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [site_id for page in pages for site_id in page] == [site.site_id for site in sites]
+
+
+def test_paginate_keyset_detects_full_last_page(db_session):
+    """Test that a final page filled exactly to page_size carries no next cursor."""
+    sites = _keyset_sites(db_session, 4)
+    query = _site_query(sites)
+
+    first, cursor = Paginator().paginate_keyset(query, Site.created_at, Site.site_id, None, 2)
+    assert cursor is not None
+
+    last, cursor = Paginator().paginate_keyset(query, Site.created_at, Site.site_id, cursor, 2)
+
+    assert [site.site_id for site in first + last] == [site.site_id for site in sites]
+    assert cursor is None
+
+
+def test_paginate_query_counts_with_window_function(db_session, monkeypatch):
+    """Test that a page of a plain entity query carries its total without a COUNT query."""
+    sites = sorted(make_sites(db_session, 5), key=lambda site: site.site_id)
+    query = _site_query(sites).order_by(Site.site_id)
+    # The window column supplies the total, so a separate count() must not run
+    monkeypatch.setattr(Query, "count", Mock(side_effect=AssertionError("count() called")))
+
+    result = Paginator().paginate_query(query, 2, 2)
+
+    assert result.items == sites[2:4]
+    assert all(isinstance(site, Site) for site in result.items)
+    assert result.total == 5
+    assert result.total_pages == 3
+
+
+def test_paginate_query_counts_past_the_end(db_session):
+    """Test that an empty page past the end still reports the real total."""
+    sites = make_sites(db_session, 5)
+
+    result = Paginator().paginate_query(_site_query(sites).order_by(Site.site_id), 4, 2)
+
+    assert result.items == []
+    assert result.total == 5
+    assert result.has_next is False
+
+
+@pytest.mark.parametrize("build_query, expected_total", [
+    pytest.param(
+        lambda session, ids: session.query(Site.is_active, func.count())
+        .filter(Site.site_id.in_(ids)).group_by(Site.is_active),
+        1, id="group-by",
+    ),
+    pytest.param(
+        lambda session, ids: session.query(Site.is_active).filter(Site.site_id.in_(ids)).distinct(),
+        1, id="distinct",
+    ),
+    pytest.param(
+        lambda session, ids: session.query(Site.name).filter(Site.site_id.in_(ids)).order_by(Site.site_id),
+        3, id="single-column",
+    ),
+])
+def test_paginate_query_falls_back_to_count(db_session, build_query, expected_total):
+    """Test that grouped, distinct and column queries count separately and keep their Row results."""
+    sites = make_sites(db_session, 3)
+    query = build_query(db_session, [site.site_id for site in sites])
+
+    result = Paginator().paginate_query(query, 1, 10)
+
+    assert result.total == expected_total
+    assert result.items == query.all()
+    assert all(hasattr(row, "_fields") for row in result.items)
@@ -10,56 +10,68 @@ This module serves as a convenient interface to the various utility modules:
 - validators: Data validation for interactions and user inputs
 """
 
-# Import everything from date_utils
-from .date_utils import *
+import importlib
 
-# Import specific logging utilities
-from .logging import (
-    setup_logging,
-    create_structured_log,
-    log_exception,
-    JsonFormatter,
-    RequestContextFilter,
-    CloudWatchHandler
-)
+# Exported names grouped by the submodule that defines them. Submodules are imported on
+# first attribute access (PEP 562), so importing one utility (e.g. date_utils) doesn't also
+# load bcrypt, PyJWT and bleach through security and validators.
+_LAZY_EXPORTS = {
+    "date_utils": (
+        "parse_datetime", "format_datetime", "convert_timezone", "validate_date_range",
+        "get_current_datetime", "get_date_range_filter", "is_valid_timezone",
+        "get_common_timezones", "is_common_timezone", "utc_to_timezone", "timezone_to_utc",
+        "DEFAULT_TIMEZONE", "DATE_FORMAT", "DATETIME_FORMAT", "DISPLAY_DATETIME_FORMAT",
+        "COMMON_TIMEZONES",
+    ),
+    "logging": (
+        "setup_logging", "create_structured_log", "log_exception",
+        "JsonFormatter", "RequestContextFilter", "CloudWatchHandler",
+    ),
+    "pagination": (
+        "get_pagination_params", "get_pagination_metadata", "apply_pagination",
+        "paginate_response", "apply_keyset_pagination", "encode_cursor", "decode_cursor",
+        "PaginatedResult", "Paginator",
+    ),
+    "security": (
+        "hash_password", "verify_password", "validate_password_strength",
+        "generate_token", "generate_session_token", "generate_federation_token", "decode_token",
+        "generate_reset_token", "log_security_event",
+        "get_request_ip", "generate_csrf_token", "validate_csrf_token", "set_secure_headers",
+        "sanitize_input", "CSRFProtect",
+    ),
+    "validators": (
+        "validate_required_field", "validate_string_length", "validate_interaction_type",
+        "validate_email", "validate_interaction", "validate_interactions_batch",
+        "sanitize_search_term", "validate_pagination_params", "validate_sort_params",
+        "ValidationError",
+        "INTERACTION_TYPES", "INTERACTION_TYPES_DISPLAY", "MAX_TITLE_LENGTH", "MAX_LEAD_LENGTH",
+        "MAX_LOCATION_LENGTH", "MAX_DESCRIPTION_LENGTH", "MAX_NOTES_LENGTH", "ALLOWED_SORT_FIELDS",
+        "ALLOWED_SORT_DIRECTIONS",
+    ),
+}
 
-# Import pagination utilities
-from .pagination import *
+_LAZY = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
 
-# Import security utilities
-from .security import *
 
-# Import validation utilities
-from .validators import *
-
-# Define all exported symbols
-__all__ = [
-    # Date utilities
-    "parse_datetime", "format_datetime", "convert_timezone", "validate_date_range",
-    "get_current_datetime", "get_date_range_filter", "is_valid_timezone",
-    "get_common_timezones", "utc_to_timezone", "timezone_to_utc",
-    "DEFAULT_TIMEZONE", "DATE_FORMAT", "DATETIME_FORMAT", "DISPLAY_DATETIME_FORMAT",
-    "COMMON_TIMEZONES",
-    
-    # Logging utilities
-    "setup_logging", "create_structured_log", "log_exception",
-    "JsonFormatter", "RequestContextFilter", "CloudWatchHandler",
+def __getattr__(name):
+    """
+    Resolves an exported name by importing its submodule on first access.
     
-    # Pagination utilities
-    "get_pagination_params", "get_pagination_metadata", "apply_pagination",
-    "paginate_response", "PaginatedResult", "Paginator",
+    Args:
+        name: Attribute being looked up on the package
     
-    # Security utilities
-    "hash_password", "verify_password", "validate_password_strength",
-    "generate_token", "decode_token", "generate_reset_token", "log_security_event",
-    "get_request_ip", "generate_csrf_token", "validate_csrf_token", "set_secure_headers",
-    "sanitize_input", "CSRFProtect",
+    Returns:
+        The attribute from the defining submodule
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    # Validation utilities
-    "validate_required_field", "validate_string_length", "validate_interaction_type",
-    "validate_email", "validate_interaction", "sanitize_search_term",
-    "validate_pagination_params", "validate_sort_params", "ValidationError",
-    "INTERACTION_TYPES", "MAX_TITLE_LENGTH", "MAX_LEAD_LENGTH", "MAX_LOCATION_LENGTH",
-    "MAX_DESCRIPTION_LENGTH", "MAX_NOTES_LENGTH", "ALLOWED_SORT_FIELDS",
-    "ALLOWED_SORT_DIRECTIONS"
-]
\ No newline at end of file
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+# Every lazily exported name is public
+__all__ = list(_LAZY)
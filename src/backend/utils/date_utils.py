@@ -4,10 +4,10 @@ Includes timezone conversion, date/time formatting, validation, and other date-r
 essential for managing interaction records with proper timezone support.
 """
 
+import re
 from datetime import datetime
-import pytz  # version 2023.3
-from typing import List, Optional, Union
-from dateutil import parser as dateutil_parser  # from python-dateutil 2.8.2
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from typing import Optional, Tuple, Union
 from sqlalchemy import Column  # version 2.0.19
 
 # Default timezone for the application
@@ -18,15 +18,40 @@ DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 DISPLAY_DATETIME_FORMAT = "%m/%d/%Y %H:%M"
 
-# List of common timezones for UI selection
-COMMON_TIMEZONES = [
+# Precompiled parsers for the fixed formats above. Each field uses the same alternation as
+# strptime's directive (see _strptime.TimeRE) and whitespace matches \s+ as it does there, so
+# both accept exactly the same strings
+_YEAR = r"(?P<year>\d\d\d\d)"
+_MONTH = r"(?P<month>1[0-2]|0[1-9]|[1-9])"
+_DAY = r"(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+_HOUR = r"(?P<hour>2[0-3]|[0-1]\d|\d)"
+_MINUTE = r"(?P<minute>[0-5]\d|\d)"
+_SECOND = r"(?P<second>6[0-1]|[0-5]\d|\d)"
+_FORMAT_PATTERNS = {
+    DATE_FORMAT: re.compile(rf"{_YEAR}-{_MONTH}-{_DAY}", re.IGNORECASE),
+    DATETIME_FORMAT: re.compile(
+        rf"{_YEAR}-{_MONTH}-{_DAY}T{_HOUR}:{_MINUTE}:{_SECOND}", re.IGNORECASE
+    ),
+    DISPLAY_DATETIME_FORMAT: re.compile(
+        rf"{_MONTH}/{_DAY}/{_YEAR}\s+{_HOUR}:{_MINUTE}", re.IGNORECASE
+    ),
+}
+
+# UTC tzinfo shared by the conversion helpers
+_UTC = ZoneInfo("UTC")
+
+# What ZoneInfo raises for unknown (KeyError subclass), malformed, or non-string names
+_TZ_LOOKUP_ERRORS = (ZoneInfoNotFoundError, ValueError, TypeError)
+
+# Common timezones for UI selection (a tuple so callers can't mutate the shared value)
+COMMON_TIMEZONES = (
     "America/New_York",
     "America/Chicago",
     "America/Denver",
     "America/Los_Angeles",
     "America/Phoenix",
     "America/Anchorage",
-    "America/Honolulu",
+    "Pacific/Honolulu",
     "America/Toronto",
     "Europe/London",
     "Europe/Paris",
@@ -35,7 +60,13 @@ COMMON_TIMEZONES = [
     "Asia/Shanghai",
     "Australia/Sydney",
     "Pacific/Auckland"
-]
+)
+
+# Set form of COMMON_TIMEZONES for O(1) membership checks
+_COMMON_TZ_SET = frozenset(COMMON_TIMEZONES)
+
+# Shared result for a date range with no bounds
+_EMPTY_FILTERS = ()
 
 
 def parse_datetime(datetime_str: str, format_str: Optional[str] = None) -> Optional[datetime]:
@@ -44,7 +75,7 @@ def parse_datetime(datetime_str: str, format_str: Optional[str] = None) -> Optio
     
     Args:
         datetime_str: String to parse
-        format_str: Format string for parsing (if None, uses flexible dateutil parsing)
+        format_str: Format string for parsing (if None, tries ISO 8601 then flexible dateutil parsing)
     
     Returns:
         Parsed datetime object or None if parsing fails
@@ -54,11 +85,23 @@ def parse_datetime(datetime_str: str, format_str: Optional[str] = None) -> Optio
     
     try:
         if format_str:
-            return datetime.strptime(datetime_str, format_str)
-        else:
-            # Use dateutil for more flexible parsing
+            pattern = _FORMAT_PATTERNS.get(format_str)
+            if pattern is None:
+                return datetime.strptime(datetime_str, format_str)
+            match = pattern.fullmatch(datetime_str)
+            if match is None:
+                return None
+            return datetime(**{field: int(value) for field, value in match.groupdict().items()})
+        
+        try:
+            # ISO 8601 covers the API's own formats; fromisoformat handles them (including 'Z') in C
+            return datetime.fromisoformat(datetime_str)
+        except ValueError:
+            # Use dateutil for more flexible parsing; imported here so callers that only
+            # parse ISO or explicit formats never pay for loading it
+            from dateutil import parser as dateutil_parser  # from python-dateutil 2.8.2
             return dateutil_parser.parse(datetime_str)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         # Parsing failed
         return None
 
@@ -81,6 +124,20 @@ def format_datetime(dt: Optional[datetime], format_str: Optional[str] = None) ->
     return dt.strftime(format_to_use)
 
 
+def _ensure_in_tz(dt: datetime, tz: ZoneInfo) -> datetime:
+    """
+    Expresses a datetime in the given timezone, treating naive values as already local to it.
+    
+    Args:
+        dt: Naive or timezone-aware datetime
+        tz: Timezone to attach or convert to
+    
+    Returns:
+        Timezone-aware datetime in tz
+    """
+    return dt.replace(tzinfo=tz) if dt.tzinfo is None else dt.astimezone(tz)
+
+
 def is_valid_timezone(timezone: str) -> bool:
     """
     Checks if a timezone string is valid.
@@ -91,12 +148,11 @@ def is_valid_timezone(timezone: str) -> bool:
     Returns:
         True if valid timezone, False otherwise
     """
-    if not timezone:
-        return False
-    
+    # The lookup is the validation; ZoneInfo caches instances, so repeats are cheap
     try:
-        return timezone in pytz.all_timezones
-    except Exception:
+        ZoneInfo(timezone)
+        return True
+    except _TZ_LOOKUP_ERRORS:
         return False
 
 
@@ -115,24 +171,16 @@ def convert_timezone(dt: Optional[datetime], from_tz: str, to_tz: str) -> Option
     if dt is None:
         return None
     
-    # Verify both timezones are valid
-    if not is_valid_timezone(from_tz) or not is_valid_timezone(to_tz):
+    # Get timezone objects; an invalid name fails the lookup itself
+    try:
+        source_tz = ZoneInfo(from_tz)
+        target_tz = ZoneInfo(to_tz)
+    except _TZ_LOOKUP_ERRORS:
         return None
     
     try:
-        # Get timezone objects
-        source_tz = pytz.timezone(from_tz)
-        target_tz = pytz.timezone(to_tz)
-        
-        # If datetime is naive (no timezone info), localize it to the source timezone
-        if dt.tzinfo is None:
-            dt = source_tz.localize(dt)
-        elif dt.tzinfo.zone != from_tz:
-            # If datetime has a different timezone, convert it to the source timezone first
-            dt = dt.astimezone(source_tz)
-        
-        # Convert to target timezone
-        return dt.astimezone(target_tz)
+        # Naive datetimes are taken to be in the source timezone, then converted
+        return _ensure_in_tz(dt, source_tz).astimezone(target_tz)
     except Exception:
         # Conversion failed
         return None
@@ -159,19 +207,10 @@ def validate_date_range(start_datetime: Optional[datetime],
     # If timezone is specified and valid, ensure both datetimes are in that timezone
     # for accurate comparison
     if timezone and is_valid_timezone(timezone):
-        tz = pytz.timezone(timezone)
+        tz = ZoneInfo(timezone)
         
-        # Normalize start_datetime
-        if start_datetime.tzinfo is None:
-            start_datetime = tz.localize(start_datetime)
-        else:
-            start_datetime = start_datetime.astimezone(tz)
-            
-        # Normalize end_datetime
-        if end_datetime.tzinfo is None:
-            end_datetime = tz.localize(end_datetime)
-        else:
-            end_datetime = end_datetime.astimezone(tz)
+        start_datetime = _ensure_in_tz(start_datetime, tz)
+        end_datetime = _ensure_in_tz(end_datetime, tz)
     
     # Compare datetimes
     return start_datetime <= end_datetime
@@ -188,13 +227,12 @@ def get_current_datetime(timezone: Optional[str] = None) -> datetime:
         Current datetime in specified timezone
     """
     tz_to_use = timezone if timezone and is_valid_timezone(timezone) else DEFAULT_TIMEZONE
-    utc_now = datetime.now(pytz.UTC)
-    return utc_now.astimezone(pytz.timezone(tz_to_use))
+    return datetime.now(ZoneInfo(tz_to_use))
 
 
 def get_date_range_filter(start_date: Optional[datetime], 
                          end_date: Optional[datetime], 
-                         date_column: Column) -> List:
+                         date_column: Column) -> Tuple:
     """
     Creates SQLAlchemy filter conditions for date range queries.
     
@@ -204,29 +242,52 @@ def get_date_range_filter(start_date: Optional[datetime],
         date_column: SQLAlchemy Column to filter on
     
     Returns:
-        List of SQLAlchemy filter conditions
+        Tuple of SQLAlchemy filter conditions
     """
-    filters = []
+    # A closed range becomes a single BETWEEN predicate; date_column should be indexed
+    # so either form can use an index range scan
+    if start_date and end_date:
+        return (date_column.between(start_date, end_date),)
     
     if start_date:
-        filters.append(date_column >= start_date)
+        return (date_column >= start_date,)
     
     if end_date:
-        filters.append(date_column <= end_date)
+        return (date_column <= end_date,)
     
-    return filters
+    return _EMPTY_FILTERS
 
 
-def get_common_timezones() -> List[str]:
+def get_common_timezones() -> Tuple[str, ...]:
     """
-    Returns a list of common timezone strings.
+    Returns the common timezone strings.
     
     Returns:
-        List of common timezone strings for UI display
+        Tuple of common timezone strings for UI display
     """
     return COMMON_TIMEZONES
 
 
+def is_common_timezone(timezone: str) -> bool:
+    """
+    Checks if a timezone string is one of the common timezones offered in the UI.
+    
+    Args:
+        timezone: Timezone string to check
+    
+    Returns:
+        True if timezone is in COMMON_TIMEZONES, False otherwise
+    """
+    return timezone in _COMMON_TZ_SET
+
+
+# COMMON_TIMEZONES is hard-coded, so check it once here instead of on every use
+for _tz in COMMON_TIMEZONES:
+    if not is_valid_timezone(_tz):
+        raise ValueError(f"COMMON_TIMEZONES contains unknown timezone {_tz!r}")
+del _tz
+
+
 def utc_to_timezone(dt: Optional[datetime], timezone: str) -> Optional[datetime]:
     """
     Converts a UTC datetime to a specific timezone.
@@ -241,20 +302,14 @@ def utc_to_timezone(dt: Optional[datetime], timezone: str) -> Optional[datetime]
     if dt is None:
         return None
     
-    if not is_valid_timezone(timezone):
+    try:
+        target_tz = ZoneInfo(timezone)
+    except _TZ_LOOKUP_ERRORS:
         return None
     
     try:
-        # If datetime is naive, assume it's UTC
-        if dt.tzinfo is None:
-            dt = pytz.UTC.localize(dt)
-        else:
-            # Ensure the datetime is in UTC
-            dt = dt.astimezone(pytz.UTC)
-        
-        # Convert to target timezone
-        target_tz = pytz.timezone(timezone)
-        return dt.astimezone(target_tz)
+        # Naive datetimes are assumed to be UTC, then converted to the target timezone
+        return _ensure_in_tz(dt, _UTC).astimezone(target_tz)
     except Exception:
         # Conversion failed
         return None
@@ -275,15 +330,15 @@ def timezone_to_utc(dt: Optional[datetime], source_timezone: str) -> Optional[da
         return None
     
     try:
-        # If datetime is naive, localize it to the source timezone
+        # If datetime is naive, attach the source timezone
         if dt.tzinfo is None:
-            if not is_valid_timezone(source_timezone):
+            try:
+                dt = dt.replace(tzinfo=ZoneInfo(source_timezone))
+            except _TZ_LOOKUP_ERRORS:
                 return None
-            source_tz = pytz.timezone(source_timezone)
-            dt = source_tz.localize(dt)
         
         # Convert to UTC
-        return dt.astimezone(pytz.UTC)
+        return dt.astimezone(_UTC)
     except Exception:
         # Conversion failed
         return None
\ No newline at end of file
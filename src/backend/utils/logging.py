@@ -1,10 +1,13 @@
+import atexit
+import copy
 import logging
 import json
 import os
+import queue
 import time
-import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple, Union
 
 # Flask imports - handling potential import errors gracefully 
 # to make the logging module usable even in non-Flask contexts
@@ -28,10 +31,38 @@ try:
 except ImportError:
     CLOUDWATCH_AVAILABLE = False
 
+# Fast JSON serialization - falls back to the standard json module if orjson is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # UTC datetimes end in 'Z' (naive ones are treated as UTC); non-string keys match json.dumps
+    ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Global constants
 DEFAULT_FORMAT = "%(asctime)s [%(levelname)s] %(component)s: %(message)s"
 DEFAULT_LOG_LEVEL = logging.INFO
 
+# RFC 3339 UTC timestamps with fixed microsecond precision for every log line
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# LogRecord attributes (and context fields handled explicitly) that aren't copied as extras
+_RESERVED_RECORD_KEYS = frozenset({
+    'args', 'asctime', 'created', 'exc_info', 'exc_text',
+    'filename', 'funcName', 'id', 'levelname', 'levelno',
+    'lineno', 'module', 'msecs', 'message', 'msg', 'name',
+    'pathname', 'process', 'processName', 'relativeCreated',
+    'stack_info', 'thread', 'threadName', 'request_id',
+    'user_id', 'site_id', 'component'
+})
+
+# Loggers already built by setup_logging, keyed by (app_name, config repr, use_cloudwatch)
+_CONFIGURED: Dict[Tuple[str, str, bool], logging.Logger] = {}
+
+# Running queue listeners, keyed by logger name, so reconfiguring a logger replaces its listener
+_LISTENERS: Dict[str, QueueListener] = {}
+
 # Map string log levels to logging module constants
 LOG_LEVELS = {
     'DEBUG': logging.DEBUG,
@@ -58,46 +89,39 @@ class JsonFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        log_data = {
-            'timestamp': datetime.utcfromtimestamp(record.created).isoformat() + 'Z',
-            'level': record.levelname,
+        rd: Dict[str, Any] = record.__dict__
+        log_data: Dict[str, Any] = {
+            # Formatted here rather than by the serializer so orjson and json emit the same string
+            'timestamp': datetime.fromtimestamp(rd['created'], tz=timezone.utc).strftime(
+                TIMESTAMP_FORMAT
+            ),
+            'level': rd['levelname'],
             'message': record.getMessage(),
+            # Component name falls back to the logger name
+            'component': rd.get('component', rd['name']),
         }
         
-        # Extract component name if available
-        if hasattr(record, 'component'):
-            log_data['component'] = record.component
-        else:
-            log_data['component'] = record.name
-            
         # Add request context if available
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
-            
-        if hasattr(record, 'user_id') and record.user_id is not None:
-            log_data['user_id'] = record.user_id
-            
-        if hasattr(record, 'site_id') and record.site_id is not None:
-            log_data['site_id'] = record.site_id
+        log_data.update({
+            key: rd[key] for key in ('request_id', 'user_id', 'site_id') if rd.get(key) is not None
+        })
         
         # Add exception info if available
-        if record.exc_info:
+        exc_info = rd['exc_info']
+        if exc_info:
             log_data['exception'] = {
-                'type': record.exc_info[0].__name__,
-                'message': str(record.exc_info[1]),
-                'traceback': self.formatException(record.exc_info)
+                'type': exc_info[0].__name__,
+                'message': str(exc_info[1]),
+                'traceback': self.formatException(exc_info)
             }
             
         # Add any extra fields from the record
-        for key, value in record.__dict__.items():
-            if key not in ('args', 'asctime', 'created', 'exc_info', 'exc_text', 
-                          'filename', 'funcName', 'id', 'levelname', 'levelno',
-                          'lineno', 'module', 'msecs', 'message', 'msg', 'name',
-                          'pathname', 'process', 'processName', 'relativeCreated',
-                          'stack_info', 'thread', 'threadName', 'request_id',
-                          'user_id', 'site_id', 'component') and not key.startswith('_'):
+        for key, value in rd.items():
+            if key not in _RESERVED_RECORD_KEYS and not key.startswith('_'):
                 log_data[key] = value
-                
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, option=ORJSON_OPTIONS).decode()
         return json.dumps(log_data)
 
 
@@ -117,6 +141,12 @@ class RequestContextFilter(logging.Filter):
         Returns:
             True to include the record in output
         """
+        # Startup code and background workers log outside a request; there is no context to
+        # look up, and a per-record random request ID would not correlate anything
+        if not has_request_context():
+            record.request_id = record.user_id = record.site_id = None
+            return True
+        
         record.request_id = get_request_id()
         record.user_id = get_user_id()
         record.site_id = get_site_id()
@@ -157,8 +187,8 @@ class CloudWatchHandler(logging.Handler):
             **kwargs
         )
         
-        # Set formatter
-        self.setFormatter(JsonFormatter())
+        # Set formatter on the watchtower handler, which is the one that formats and sends
+        self.handler.setFormatter(JsonFormatter())
     
     def emit(self, record: logging.LogRecord) -> None:
         """Sends a log record to CloudWatch.
@@ -167,8 +197,7 @@ class CloudWatchHandler(logging.Handler):
             record: The log record to send
         """
         try:
-            # Format the record and send to CloudWatch
-            formatted_record = self.format(record)
+            # Send to CloudWatch; the watchtower handler formats the record once
             self.handler.emit(record)
         except Exception as e:
             # Handle any AWS-related exceptions
@@ -186,23 +215,51 @@ class CloudWatchHandler(logging.Handler):
             super().close()
 
 
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the handler on the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Freezes the message arguments but keeps exc_info and extras for JsonFormatter.
+        
+        Args:
+            record: The log record to enqueue
+            
+        Returns:
+            Copy of the record safe to hand to another thread
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def get_request_id() -> str:
     """Extracts or generates a request ID from the current Flask request context.
     
     Returns:
         Unique request identifier
     """
-    if has_request_context():
-        # Try to get from request headers
-        if hasattr(request, 'headers') and request.headers.get('X-Request-ID'):
-            return request.headers.get('X-Request-ID')
-            
-        # Check if already set in request object
-        if hasattr(request, 'request_id'):
-            return request.request_id
-    
-    # Generate new UUID if no existing request ID
-    return str(uuid.uuid4())
+    if not has_request_context():
+        # Generate a random 128-bit hex ID if no existing request ID
+        return os.urandom(16).hex()
+    
+    # Reuse the value resolved for an earlier record in this request
+    cached = getattr(g, '_log_request_id', None)
+    if cached:
+        return cached
+    
+    # Try to get from request headers
+    if hasattr(request, 'headers') and request.headers.get('X-Request-ID'):
+        request_id = request.headers.get('X-Request-ID')
+    # Check if already set in request object
+    elif hasattr(request, 'request_id'):
+        request_id = request.request_id
+    else:
+        # Generate one ID per request so every record in it shares it
+        request_id = os.urandom(16).hex()
+    
+    g._log_request_id = request_id
+    return request_id
 
 
 def get_user_id() -> Optional[Union[str, int]]:
@@ -211,16 +268,27 @@ def get_user_id() -> Optional[Union[str, int]]:
     Returns:
         User ID if authenticated user is present, None otherwise
     """
-    if has_request_context():
-        # Check if current_user is available from flask-login
-        if hasattr(g, 'current_user') and hasattr(g.current_user, 'id'):
-            return g.current_user.id
-        
-        # Alternative: check JWT claims if using JWT authentication
-        if hasattr(g, 'jwt_claims') and g.jwt_claims.get('sub'):
-            return g.jwt_claims.get('sub')
+    if not has_request_context():
+        return None
+    
+    # Reuse the value resolved for an earlier record in this request
+    cached = getattr(g, '_log_user_id', None)
+    if cached is not None:
+        return cached
+    
+    user_id = None
+    
+    # Check if current_user is available from flask-login
+    if hasattr(g, 'current_user') and hasattr(g.current_user, 'id'):
+        user_id = g.current_user.id
+    # Alternative: check JWT claims if using JWT authentication
+    elif hasattr(g, 'jwt_claims') and g.jwt_claims.get('sub'):
+        user_id = g.jwt_claims.get('sub')
     
-    return None
+    # Only cache a hit; authentication may populate g later in the request
+    if user_id is not None:
+        g._log_user_id = user_id
+    return user_id
 
 
 def get_site_id() -> Optional[Union[str, int]]:
@@ -229,20 +297,30 @@ def get_site_id() -> Optional[Union[str, int]]:
     Returns:
         Site ID if site context is available, None otherwise
     """
-    if has_request_context():
-        # Check if site_id is in request context
-        if hasattr(g, 'site_id'):
-            return g.site_id
-        
-        # Check if site context is in request object
-        if hasattr(request, 'site_context') and hasattr(request.site_context, 'id'):
-            return request.site_context.id
-        
-        # Check if in JWT claims
-        if hasattr(g, 'jwt_claims') and g.jwt_claims.get('site_id'):
-            return g.jwt_claims.get('site_id')
-    
-    return None
+    if not has_request_context():
+        return None
+    
+    # Reuse the value resolved for an earlier record in this request
+    cached = getattr(g, '_log_site_id', None)
+    if cached is not None:
+        return cached
+    
+    site_id = None
+    
+    # Check if site_id is in request context
+    if hasattr(g, 'site_id'):
+        site_id = g.site_id
+    # Check if site context is in request object
+    elif hasattr(request, 'site_context') and hasattr(request.site_context, 'id'):
+        site_id = request.site_context.id
+    # Check if in JWT claims
+    elif hasattr(g, 'jwt_claims') and g.jwt_claims.get('site_id'):
+        site_id = g.jwt_claims.get('site_id')
+    
+    # Only cache a hit; site context may be set later in the request
+    if site_id is not None:
+        g._log_site_id = site_id
+    return site_id
 
 
 def create_structured_log(
@@ -262,28 +340,27 @@ def create_structured_log(
     Returns:
         Structured log entry with all required fields
     """
-    # Create base log structure
+    in_request = has_request_context()
     log_entry = {
-        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'timestamp': datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT),
         'level': level,
         'component': component,
         'message': message,
-        'request_id': get_request_id()
+        # Outside a request there is no user or site to look up; every entry gets a fresh ID
+        'request_id': get_request_id() if in_request else os.urandom(16).hex(),
     }
     
-    # Add user_id if available
-    user_id = get_user_id()
-    if user_id is not None:
-        log_entry['user_id'] = user_id
-    
-    # Add site_id if available
-    site_id = get_site_id()
-    if site_id is not None:
-        log_entry['site_id'] = site_id
+    if in_request:
+        user_id = get_user_id()
+        site_id = get_site_id()
+        if user_id is not None:
+            log_entry['user_id'] = user_id
+        if site_id is not None:
+            log_entry['site_id'] = site_id
     
-    # Add any extra fields
+    # Merge extra fields in place rather than unpacking into a new dict
     if extra_fields:
-        log_entry.update(extra_fields)
+        log_entry |= extra_fields
     
     return log_entry
 
@@ -299,25 +376,57 @@ def log_exception(exc: Exception, component: str = 'app', extra_fields: Optional
     # Get logger
     logger = logging.getLogger(component)
     
+    # Skip building any context when ERROR records would be dropped anyway
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    
     # Create extra context with exception details
     context = {
+        'component': component,
         'exception_type': exc.__class__.__name__,
         'exception_message': str(exc),
     }
     
-    # Add traceback if available
-    import traceback
-    context['traceback'] = traceback.format_exc()
-    
-    # Add any additional context
+    # Merge any additional context in place
     if extra_fields:
-        context.update(extra_fields)
+        context |= extra_fields
     
-    # Log the error
-    logger.error(f"Exception: {str(exc)}", extra={
-        'component': component,
-        **context
-    })
+    # Log the error; passing the exception as exc_info lets the formatter render the
+    # traceback only when a handler actually emits the record
+    logger.error("Exception: %s", exc, exc_info=exc, extra=context)
+
+
+def _stop_listeners() -> None:
+    """Stops every queue listener, flushing records still waiting in the queues."""
+    for listener in _LISTENERS.values():
+        listener.stop()
+    _LISTENERS.clear()
+
+
+atexit.register(_stop_listeners)
+
+
+def _restart_listeners_after_fork() -> None:
+    """Gives each configured logger a new queue and listener in a forked child process.
+    
+    A fork copies the queues but not the listener threads draining them, so without this a
+    worker forked after setup_logging (e.g. under Gunicorn's preload_app) would fill a queue
+    nobody reads. The copied queue is replaced too, since its lock may have been held by the
+    parent's listener thread at fork time.
+    """
+    for name, old_listener in list(_LISTENERS.items()):
+        log_queue = queue.SimpleQueue()
+        for handler in logging.getLogger(name).handlers:
+            if isinstance(handler, QueueHandler):
+                handler.queue = log_queue
+        
+        listener = QueueListener(log_queue, *old_listener.handlers, respect_handler_level=True)
+        listener.start()
+        _LISTENERS[name] = listener
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
 
 
 def setup_logging(app_name: str, config: Optional[Dict[str, Any]] = None, use_cloudwatch: bool = False) -> logging.Logger:
@@ -333,6 +442,17 @@ def setup_logging(app_name: str, config: Optional[Dict[str, Any]] = None, use_cl
     """
     config = config or {}
     
+    # Repeat calls with the same settings (app factory, tests) reuse the existing handlers
+    # instead of rebuilding them. The key is built from a repr rather than a hash so configs
+    # with unhashable values (e.g. AWS_CREDENTIALS dicts) are memoized too.
+    key = (app_name, repr(sorted(config.items())), use_cloudwatch)
+    if key in _CONFIGURED:
+        return _CONFIGURED[key]
+    
+    # The handlers are about to be replaced, so earlier entries for this logger are stale
+    for stale in [k for k in _CONFIGURED if k[0] == app_name]:
+        del _CONFIGURED[stale]
+    
     # Get log level from config or environment
     log_level_name = config.get('LOG_LEVEL') or os.environ.get('LOG_LEVEL', 'INFO')
     log_level = LOG_LEVELS.get(log_level_name, DEFAULT_LOG_LEVEL)
@@ -341,6 +461,11 @@ def setup_logging(app_name: str, config: Optional[Dict[str, Any]] = None, use_cl
     logger = logging.getLogger(app_name)
     logger.setLevel(log_level)
     
+    # Stop the previous listener first so it drains its queue into the old handlers
+    previous_listener = _LISTENERS.pop(app_name, None)
+    if previous_listener is not None:
+        previous_listener.stop()
+    
     # Clear existing handlers to avoid duplicates on reinitialization
     if logger.handlers:
         logger.handlers.clear()
@@ -348,10 +473,17 @@ def setup_logging(app_name: str, config: Optional[Dict[str, Any]] = None, use_cl
     # Add request context filter
     logger.addFilter(RequestContextFilter())
     
+    # Every handler sits behind one queue so formatting and I/O stay off the request path.
+    # Records logged while the handlers are being built wait in the queue until the listener starts.
+    # The queue is unbounded so bursts are never dropped; a handler that stays slower than the
+    # log rate grows memory instead of losing records.
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    
     # Console handler with JSON formatting
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(JsonFormatter())
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Add CloudWatch handler if enabled
     if use_cloudwatch:
@@ -379,11 +511,16 @@ def setup_logging(app_name: str, config: Optional[Dict[str, Any]] = None, use_cl
                     log_stream=log_stream,
                     aws_credentials=aws_credentials
                 )
-                logger.addHandler(cloudwatch_handler)
+                handlers.append(cloudwatch_handler)
                 logger.info(f"CloudWatch logging enabled with log group: {log_group}")
                 
             except Exception as e:
                 logger.error(f"Failed to initialize CloudWatch logging: {str(e)}")
     
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _LISTENERS[app_name] = listener
+    
     logger.info(f"Logging initialized for {app_name} at level {log_level_name}")
+    _CONFIGURED[key] = logger
     return logger
\ No newline at end of file
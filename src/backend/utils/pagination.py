@@ -3,9 +3,14 @@ Utility module providing pagination functionality for API responses and database
 Enables the Finder view to display paginated interaction records with consistent navigation.
 """
 
+import base64
+import binascii
+import json
+from datetime import datetime
+
 from flask import request  # version 2.3.2
 from typing import Dict, List, Optional, Any, Tuple, Union
-import math
+from sqlalchemy import DateTime, func, inspect, tuple_
 from sqlalchemy.orm import Query  # version 2.0.19
 
 from .validators import validate_pagination_params
@@ -17,6 +22,25 @@ MAX_PAGE_SIZE = 100
 MIN_PAGE_SIZE = 10
 
 
+def _int_arg(name: str, default: int) -> int:
+    """
+    Read an integer query parameter, falling back to the default when it is missing or malformed.
+    
+    Args:
+        name: Query parameter name
+        default: Value used when the parameter is absent or not an integer
+    
+    Returns:
+        int: Parsed parameter value
+    """
+    # int() accepts the same forms as before (' 5', '+5') and rejects everything else,
+    # including values past the int-string digit limit
+    try:
+        return int(request.args.get(name, default))
+    except (ValueError, TypeError):
+        return default
+
+
 def get_pagination_params() -> Tuple[int, int]:
     """
     Extract and validate pagination parameters from HTTP request.
@@ -25,15 +49,8 @@ def get_pagination_params() -> Tuple[int, int]:
         Tuple[int, int]: Validated (page, page_size) integers
     """
     # Extract page and page_size from request query parameters
-    try:
-        page = int(request.args.get('page', DEFAULT_PAGE))
-    except (ValueError, TypeError):
-        page = DEFAULT_PAGE
-    
-    try:
-        page_size = int(request.args.get('page_size', DEFAULT_PAGE_SIZE))
-    except (ValueError, TypeError):
-        page_size = DEFAULT_PAGE_SIZE
+    page = _int_arg('page', DEFAULT_PAGE)
+    page_size = _int_arg('page_size', DEFAULT_PAGE_SIZE)
     
     # Use validate_pagination_params to ensure values are within valid ranges
     page, page_size = validate_pagination_params(page, page_size)
@@ -53,8 +70,8 @@ def get_pagination_metadata(total_items: int, page: int, page_size: int) -> Dict
     Returns:
         Dict containing pagination metadata
     """
-    # Calculate total_pages using math.ceil(total_items / page_size)
-    total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+    # Calculate total_pages with integer ceiling division (no float rounding at large totals)
+    total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 1
     
     # Ensure page does not exceed total_pages
     page = min(page, total_pages)
@@ -98,6 +115,111 @@ def apply_pagination(query: Query, page: int, page_size: int) -> Query:
     return query.offset(offset).limit(page_size)
 
 
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """
+    Encode the last row's sort key and ID as an opaque keyset-pagination cursor.
+    
+    Args:
+        sort_value: Value of the sort column on the last row of the page
+        row_id: Primary key of the last row of the page
+    
+    Returns:
+        URL-safe base64 cursor string
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str, sort_column: Any) -> Tuple[Any, Any]:
+    """
+    Decode a keyset-pagination cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        sort_column: Column the cursor's sort value belongs to
+    
+    Returns:
+        Tuple of (sort_value, row_id)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        
+        # Datetimes travel as ISO strings; restore them so the comparison binds the right type
+        if sort_value is not None and isinstance(sort_column.type, DateTime):
+            sort_value = datetime.fromisoformat(sort_value)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    
+    return sort_value, row_id
+
+
+def apply_keyset_pagination(query: Query, sort_column: Any, id_column: Any,
+                            last_value: Any, last_id: Any, page_size: int) -> Query:
+    """
+    Apply keyset (seek) pagination to a SQLAlchemy query.
+    
+    Rows are ordered ascending by (sort_column, id_column) and only rows after the given
+    key are returned, so an index on those columns serves deep pages without scanning
+    the skipped rows the way OFFSET does. sort_column must not be nullable.
+    
+    Args:
+        query: SQLAlchemy query object
+        sort_column: Column to sort by
+        id_column: Unique tie-breaker column (usually the primary key)
+        last_value: Sort value of the last row on the previous page (None for the first page)
+        last_id: ID of the last row on the previous page (None for the first page)
+        page_size: Number of items per page
+    
+    Returns:
+        SQLAlchemy query with keyset pagination applied
+    """
+    if last_id is not None:
+        query = query.filter(tuple_(sort_column, id_column) > tuple_(last_value, last_id))
+    
+    # Drop any ORDER BY already on the query; the cursor is only valid for exactly this order
+    return query.order_by(None).order_by(sort_column, id_column).limit(page_size)
+
+
+def _groups_or_dedupes(query: Query) -> bool:
+    """
+    Check whether a query has a GROUP BY or DISTINCT clause.
+    
+    Select has no public accessor for either, so this reads its private attributes;
+    they are stable across SQLAlchemy 2.0.x but must be re-checked on upgrade.
+    
+    Args:
+        query: SQLAlchemy query object
+    
+    Returns:
+        True if the query groups or de-duplicates its rows
+    """
+    statement = query.statement
+    return bool(statement._group_by_clauses) or bool(statement._distinct)
+
+
+def _selects_single_entity(query: Query) -> bool:
+    """
+    Check whether a query selects exactly one mapped entity (e.g. Site.query).
+    
+    Args:
+        query: SQLAlchemy query object
+    
+    Returns:
+        True if each result row is a single model instance
+    """
+    descriptions = query.column_descriptions
+    if len(descriptions) != 1:
+        return False
+    
+    entity = inspect(descriptions[0]['expr'], raiseerr=False)
+    return entity is not None and (entity.is_mapper or entity.is_aliased_class)
+
+
 def paginate_response(items: List[Any], total_items: int, page: int, page_size: int) -> Dict[str, Any]:
     """
     Format API response with pagination metadata and results.
@@ -145,8 +267,8 @@ class PaginatedResult:
         self.page = page
         self.page_size = page_size
         
-        # Calculate total_pages using math.ceil(total / page_size)
-        self.total_pages = math.ceil(total / page_size) if total > 0 else 1
+        # Calculate total_pages with integer ceiling division
+        self.total_pages = (total + page_size - 1) // page_size if total > 0 else 1
         
         # Calculate has_next flag (page < total_pages)
         self.has_next = page < self.total_pages
@@ -159,6 +281,18 @@ class PaginatedResult:
         
         # Calculate prev_page if has_prev is True
         self.prev_page = page - 1 if self.has_prev else None
+        
+        # Metadata never changes after construction, so build the response block once
+        self._pagination = {
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': self.total_pages,
+            'has_next': self.has_next,
+            'has_prev': self.has_prev,
+            'next_page': self.next_page,
+            'prev_page': self.prev_page
+        }
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -167,23 +301,7 @@ class PaginatedResult:
         Returns:
             Dict with items and pagination metadata
         """
-        # Construct dictionary with items list
-        result = {
-            'data': self.items,
-            'pagination': {
-                'total': self.total,
-                'page': self.page,
-                'page_size': self.page_size,
-                'total_pages': self.total_pages,
-                'has_next': self.has_next,
-                'has_prev': self.has_prev,
-                'next_page': self.next_page,
-                'prev_page': self.prev_page
-            }
-        }
-        
-        # Return the formatted dictionary
-        return result
+        return {'data': self.items, 'pagination': self._pagination}
 
 
 class Paginator:
@@ -203,14 +321,57 @@ class Paginator:
         Returns:
             PaginatedResult containing items and pagination metadata
         """
-        # Execute count query to get total items count
-        total = query.count()
+        # A window column would change what aggregating or de-duplicating queries count, and
+        # would turn column queries' Row results into scalars, so those keep the separate
+        # count + fetch round-trips
+        if _groups_or_dedupes(query) or not _selects_single_entity(query):
+            total = query.count()
+            items = apply_pagination(query, page, page_size).all()
+            return PaginatedResult(items, total, page, page_size)
         
-        # Apply pagination to the query using apply_pagination
-        paginated_query = apply_pagination(query, page, page_size)
+        # Fetch the page and the overall count in one round-trip with COUNT(*) OVER ()
+        rows = apply_pagination(
+            query.add_columns(func.count().over().label('_total')), page, page_size
+        ).all()
+        items = [row[0] for row in rows]
         
-        # Execute paginated query to get items for current page
-        items = paginated_query.all()
+        if rows:
+            total = rows[0]._total
+        else:
+            # An empty page past the end carries no count; ask for it explicitly
+            total = query.count() if page > 1 else 0
         
         # Create and return PaginatedResult with items and metadata
-        return PaginatedResult(items, total, page, page_size)
\ No newline at end of file
+        return PaginatedResult(items, total, page, page_size)
+    
+    def paginate_keyset(self, query: Query, sort_column: Any, id_column: Any,
+                        cursor: Optional[str], page_size: int) -> Tuple[List[Any], Optional[str]]:
+        """
+        Fetch one page of a query with keyset pagination.
+        
+        Prefer this over paginate_query for deep pages of large, sorted result sets;
+        offset pagination stays the simpler choice for the first few pages.
+        
+        Args:
+            query: SQLAlchemy query object
+            sort_column: Column to sort by
+            id_column: Unique tie-breaker column (usually the primary key)
+            cursor: Cursor returned with the previous page, or None for the first page
+            page_size: Number of items per page
+        
+        Returns:
+            Tuple of (items, next_cursor); next_cursor is None on the last page
+        """
+        last_value, last_id = decode_cursor(cursor, sort_column) if cursor else (None, None)
+        
+        # Fetch one extra row so a full final page isn't followed by an empty one
+        items = apply_keyset_pagination(
+            query, sort_column, id_column, last_value, last_id, page_size + 1
+        ).all()
+        
+        if len(items) <= page_size:
+            return items, None
+        
+        items = items[:page_size]
+        last = items[-1]
+        return items, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -4,18 +4,22 @@ Implements data validation logic for interaction records, search parameters, and
 to ensure data integrity and security.
 """
 
+import functools
 import re
+import threading
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import bleach  # version 6.0.0
 
 from .date_utils import validate_date_range, is_valid_timezone
 
-# List of allowed interaction types
-INTERACTION_TYPES = [
+# Allowed interaction types in display order (API listings, error messages)
+INTERACTION_TYPES_DISPLAY = (
     "Meeting", "Call", "Email", "Update", "Training", "Review", 
     "Presentation", "Conference", "Workshop", "Other"
-]
+)
+# Membership checks use frozensets for O(1) lookups
+INTERACTION_TYPES = frozenset(INTERACTION_TYPES_DISPLAY)
 
 # Field length constraints
 MAX_TITLE_LENGTH = 255
@@ -24,21 +28,55 @@ MAX_LOCATION_LENGTH = 255
 MAX_DESCRIPTION_LENGTH = 5000
 MAX_NOTES_LENGTH = 2000
 
+# (field, max length, label used in the error message) for the optional-length checks
+_LENGTH_CHECKS = (
+    ("title", MAX_TITLE_LENGTH, "Title"),
+    ("lead", MAX_LEAD_LENGTH, "Lead name"),
+    ("location", MAX_LOCATION_LENGTH, "Location"),
+    ("description", MAX_DESCRIPTION_LENGTH, "Description"),
+    ("notes", MAX_NOTES_LENGTH, "Notes"),
+)
+
 # Pagination defaults and limits
 DEFAULT_PAGE = 1
 DEFAULT_PER_PAGE = 25
 MAX_PER_PAGE = 100
 
 # Sorting parameters
-ALLOWED_SORT_FIELDS = [
+ALLOWED_SORT_FIELDS = frozenset((
     "title", "type", "lead", "start_datetime", "end_datetime", 
     "location", "created_at", "updated_at"
-]
-ALLOWED_SORT_DIRECTIONS = ["asc", "desc"]
+))
+ALLOWED_SORT_DIRECTIONS = frozenset(("asc", "desc"))
+_DEFAULT_SORT = ("created_at", "desc")
 
 # Regular expressions for validation
 EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 
+# Compiled once at import so validation calls skip the re module's pattern cache
+_EMAIL_RE = re.compile(EMAIL_REGEX, re.ASCII)
+
+# Per-thread HTML cleaner with bleach.clean's default whitelist. Building one per call re-creates
+# the html5lib parser and serializer each time; Cleaner keeps parser state, so threads don't
+# share one.
+_cleaners = threading.local()
+
+
+def _get_cleaner() -> bleach.Cleaner:
+    """
+    Returns this thread's bleach Cleaner, creating it on first use.
+    
+    Returns:
+        Cleaner configured like bleach.clean(..., strip=True)
+    """
+    cleaner = getattr(_cleaners, "cleaner", None)
+    if cleaner is None:
+        cleaner = _cleaners.cleaner = bleach.Cleaner(strip=True)
+    return cleaner
+
+# Characters stripped from search terms, removed with str.translate in a single C-level pass
+_SEARCH_STRIP_TABLE = str.maketrans('', '', ';"\'')
+
 
 class ValidationError(Exception):
     """
@@ -125,7 +163,8 @@ def validate_interaction_type(type_value: str) -> bool:
     Returns:
         True if type is valid, False otherwise
     """
-    return type_value in INTERACTION_TYPES
+    # Frozenset membership hashes its operand, so unhashable input (lists, dicts) must not reach it
+    return isinstance(type_value, str) and type_value in INTERACTION_TYPES
 
 
 def validate_email(email: str) -> bool:
@@ -141,7 +180,21 @@ def validate_email(email: str) -> bool:
     if email is None:
         return False
     
-    return bool(re.match(EMAIL_REGEX, email))
+    return bool(_EMAIL_RE.match(email))
+
+
+@functools.lru_cache(maxsize=512)
+def _timezone_ok(timezone: str) -> bool:
+    """
+    Memoized is_valid_timezone; invalid names otherwise hit the tz database on every call.
+    
+    Args:
+        timezone: Timezone string to validate
+    
+    Returns:
+        True if valid timezone, False otherwise
+    """
+    return is_valid_timezone(timezone)
 
 
 def validate_interaction(interaction_data: Dict[str, Any], is_creation: bool = True) -> Dict[str, str]:
@@ -164,41 +217,24 @@ def validate_interaction(interaction_data: Dict[str, Any], is_creation: bool = T
             if field not in interaction_data or not validate_required_field(interaction_data.get(field), field):
                 errors[field] = f"{field.replace('_', ' ').title()} is required"
     
-    # Validate title length
-    if "title" in interaction_data and interaction_data["title"] is not None:
-        if not validate_string_length(interaction_data["title"], MAX_TITLE_LENGTH, "title"):
-            errors["title"] = f"Title must be less than {MAX_TITLE_LENGTH} characters"
+    # Validate field lengths
+    for field, max_length, label in _LENGTH_CHECKS:
+        value = interaction_data.get(field)
+        if value is not None and len(value) > max_length:
+            errors[field] = f"{label} must be less than {max_length} characters"
     
     # Validate interaction type
     if "type" in interaction_data and interaction_data["type"] is not None:
         if not validate_interaction_type(interaction_data["type"]):
-            errors["type"] = f"Type must be one of: {', '.join(INTERACTION_TYPES)}"
-    
-    # Validate lead length
-    if "lead" in interaction_data and interaction_data["lead"] is not None:
-        if not validate_string_length(interaction_data["lead"], MAX_LEAD_LENGTH, "lead"):
-            errors["lead"] = f"Lead name must be less than {MAX_LEAD_LENGTH} characters"
+            errors["type"] = f"Type must be one of: {', '.join(INTERACTION_TYPES_DISPLAY)}"
     
     # Validate timezone
     if "timezone" in interaction_data and interaction_data["timezone"] is not None:
-        if not is_valid_timezone(interaction_data["timezone"]):
+        timezone = interaction_data["timezone"]
+        # Only strings are cacheable (and valid); anything else is rejected directly
+        if not (isinstance(timezone, str) and _timezone_ok(timezone)):
             errors["timezone"] = "Invalid timezone"
     
-    # Validate location length
-    if "location" in interaction_data and interaction_data["location"] is not None:
-        if not validate_string_length(interaction_data["location"], MAX_LOCATION_LENGTH, "location"):
-            errors["location"] = f"Location must be less than {MAX_LOCATION_LENGTH} characters"
-    
-    # Validate description length
-    if "description" in interaction_data and interaction_data["description"] is not None:
-        if not validate_string_length(interaction_data["description"], MAX_DESCRIPTION_LENGTH, "description"):
-            errors["description"] = f"Description must be less than {MAX_DESCRIPTION_LENGTH} characters"
-    
-    # Validate notes length
-    if "notes" in interaction_data and interaction_data["notes"] is not None:
-        if not validate_string_length(interaction_data["notes"], MAX_NOTES_LENGTH, "notes"):
-            errors["notes"] = f"Notes must be less than {MAX_NOTES_LENGTH} characters"
-    
     # Validate date range
     if "start_datetime" in interaction_data and "end_datetime" in interaction_data:
         start = interaction_data.get("start_datetime")
@@ -211,6 +247,28 @@ def validate_interaction(interaction_data: Dict[str, Any], is_creation: bool = T
     return errors
 
 
+def validate_interactions_batch(records: List[Dict[str, Any]],
+                                is_creation: bool = True) -> Dict[int, Dict[str, str]]:
+    """
+    Validates many interaction records, e.g. for a bulk import.
+    
+    Args:
+        records: Interaction data dictionaries
+        is_creation: Whether the records are new interactions (True) or updates (False)
+    
+    Returns:
+        Dictionary mapping the index of each invalid record to its validation errors;
+        empty if every record is valid
+    """
+    batch_errors = {}
+    for index, record in enumerate(records):
+        errors = validate_interaction(record, is_creation)
+        if errors:
+            batch_errors[index] = errors
+    
+    return batch_errors
+
+
 def sanitize_search_term(search_term: str) -> str:
     """
     Sanitizes user input for search operations to prevent injection attacks.
@@ -228,10 +286,10 @@ def sanitize_search_term(search_term: str) -> str:
     search_term = search_term.strip()
     
     # Use bleach to clean any HTML/script content
-    search_term = bleach.clean(search_term, strip=True)
+    search_term = _get_cleaner().clean(search_term)
     
     # Remove potential SQL injection patterns
-    search_term = re.sub(r'[;"\']', '', search_term)
+    search_term = search_term.translate(_SEARCH_STRIP_TABLE)
     
     return search_term
 
@@ -272,6 +330,10 @@ def validate_sort_params(sort_by: Optional[str] = None,
     Returns:
         Tuple of (sort_by, sort_direction) with validated values
     """
+    # Most list requests don't specify sorting; skip the lookups entirely
+    if sort_by is None and sort_direction is None:
+        return _DEFAULT_SORT
+    
     # Normalize sort_by
     validated_sort_by = "created_at"
     if sort_by in ALLOWED_SORT_FIELDS:
@@ -13,5 +13,30 @@ from config import get_config
 # The configuration is determined by environment variables (e.g., FLASK_ENV)
 application = create_app(get_config())
 
+
+def _warmup():
+    """
+    Pays one-time lazy initialization costs at import time.
+    
+    With Gunicorn's preload_app the master runs this before forking, so workers share the
+    warmed pages copy-on-write instead of each paying the cost on its first request. Logging
+    listener threads don't survive the fork; utils.logging restarts them in each worker.
+    """
+    import jwt
+    from utils.date_utils import DEFAULT_TIMEZONE
+    from utils.security import JWT_SESSION_ALGORITHM
+    from utils.validators import validate_interaction
+    
+    # Materialize PyJWT's algorithm registry and the HMAC signing path
+    token = jwt.encode({'warmup': True}, 'warmup', algorithm=JWT_SESSION_ALGORITHM)
+    jwt.decode(token, 'warmup', algorithms=[JWT_SESSION_ALGORITHM])
+    
+    # Load zoneinfo data for the common timezones into the validator's cache
+    for timezone in ('UTC', DEFAULT_TIMEZONE):
+        validate_interaction({'timezone': timezone}, is_creation=False)
+
+
+_warmup()
+
 # This application object is used by WSGI servers to serve the Flask application
-# Example usage with Gunicorn: gunicorn -w 4 wsgi:application
\ No newline at end of file
+# Example usage with Gunicorn: gunicorn --preload -w 4 wsgi:application
\ No newline at end of file